@@ -3,8 +3,11 @@ RaceIQ Demo Script
 Quick demonstration of all features
 """
 
+import os
 import sys
-sys.path.append('.')
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
 
 from src.data_loader import RaceDataLoader
 from src.analysis.tire_degradation import TireDegradationAnalyzer
@@ -21,7 +24,7 @@ def main():
     
     # Initialize
     print("📊 Loading race data...")
-    loader = RaceDataLoader()
+    loader = RaceDataLoader(os.path.join(PROJECT_ROOT, 'barber'))
     tire_analyzer = TireDegradationAnalyzer()
     line_analyzer = RacingLineAnalyzer()
     
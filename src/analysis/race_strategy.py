@@ -5,10 +5,22 @@ Uses actual race data to calculate pit windows, fuel strategy, and race pace
 
 import pandas as pd
 import numpy as np
+import weakref
 from typing import Dict, List, Optional, Tuple
 from sklearn.linear_model import LinearRegression
 
 
+def parse_lap_time(t) -> Optional[float]:
+    """Lap time ('M:SS.mmm' or plain seconds) in seconds; None if unparseable"""
+    try:
+        if ':' in str(t):
+            parts = str(t).split(':')
+            return float(parts[0]) * 60 + float(parts[1])
+        return float(t)
+    except:
+        return None
+
+
 class RaceStrategyAnalyzer:
     """Analyze race strategy using real telemetry and timing data"""
     
@@ -17,6 +29,51 @@ class RaceStrategyAnalyzer:
         self.tank_capacity = 50.0  # liters
         self.pit_stop_time = 45.0  # seconds (typical pit stop)
         
+        # (frame weakref, frame length, {vehicle: row positions}) for the
+        # last analysis frame seen, so each call doesn't rescan NUMBER
+        self._vehicle_index = None
+    
+    def vehicle_positions(self, analysis_df: pd.DataFrame) -> Dict:
+        """Row positions of each vehicle in analysis_df, in order of first appearance"""
+        cached = self._vehicle_index
+        if cached is not None and cached[0]() is analysis_df and cached[1] == len(analysis_df):
+            return cached[2]
+        
+        codes, numbers = pd.factorize(analysis_df['NUMBER'].to_numpy())
+        order = np.argsort(codes, kind='stable')
+        starts = np.searchsorted(codes[order], np.arange(len(numbers) + 1))
+        index = {number: order[starts[i]:starts[i + 1]] for i, number in enumerate(numbers)}
+        
+        self._vehicle_index = (weakref.ref(analysis_df), len(analysis_df), index)
+        return index
+    
+    def vehicle_laps(
+        self,
+        analysis_df: pd.DataFrame,
+        vehicle_number: int,
+        current_lap: Optional[int] = None
+    ) -> pd.DataFrame:
+        """A vehicle's rows of analysis_df (up to current_lap, if given), as a copy"""
+        positions = self.vehicle_positions(analysis_df).get(vehicle_number)
+        if positions is None:
+            return analysis_df.iloc[:0].copy()
+        
+        vehicle_laps = analysis_df.iloc[positions]
+        if current_lap is not None:
+            vehicle_laps = vehicle_laps[vehicle_laps['LAP_NUMBER'] <= current_lap]
+        return vehicle_laps.copy()
+    
+    def lap_seconds(self, laps: pd.DataFrame) -> pd.Series:
+        """
+        Lap times in seconds
+        
+        RaceDataLoader parses LAP_TIME into lap_time_seconds once at load;
+        frames without that column are parsed here.
+        """
+        if 'lap_time_seconds' in laps.columns:
+            return laps['lap_time_seconds']
+        return laps['LAP_TIME'].apply(parse_lap_time)
+        
     def calculate_fuel_strategy(
         self,
         analysis_df: pd.DataFrame,
@@ -29,7 +86,7 @@ class RaceStrategyAnalyzer:
         Calculate fuel strategy based on actual consumption patterns
         Uses real lap times and speeds to estimate fuel usage
         """
-        vehicle_laps = analysis_df[analysis_df['NUMBER'] == vehicle_number].copy()
+        vehicle_laps = self.vehicle_laps(analysis_df, vehicle_number)
         
         if len(vehicle_laps) == 0:
             return {'error': 'No data for vehicle'}
@@ -94,26 +151,13 @@ class RaceStrategyAnalyzer:
         Analyze race pace using real lap time data
         Compare to competitors and predict finish position
         """
-        vehicle_laps = analysis_df[
-            (analysis_df['NUMBER'] == vehicle_number) & 
-            (analysis_df['LAP_NUMBER'] <= current_lap)
-        ].copy()
+        vehicle_laps = self.vehicle_laps(analysis_df, vehicle_number, current_lap)
         
         if len(vehicle_laps) < 3:
             return {'error': 'Insufficient data'}
         
-        # Parse lap times
-        def parse_time(t):
-            try:
-                if ':' in str(t):
-                    parts = str(t).split(':')
-                    return float(parts[0]) * 60 + float(parts[1])
-                return float(t)
-            except:
-                return None
-        
         # Parse all lap times first
-        vehicle_laps['lap_seconds'] = vehicle_laps['LAP_TIME'].apply(parse_time)
+        vehicle_laps['lap_seconds'] = self.lap_seconds(vehicle_laps)
         vehicle_laps = vehicle_laps.dropna(subset=['lap_seconds'])
         
         if len(vehicle_laps) == 0:
@@ -143,20 +187,16 @@ class RaceStrategyAnalyzer:
             trend = 0
         
         # Compare to competitors
-        all_vehicles = analysis_df['NUMBER'].unique()
         competitor_paces = []
         
-        for comp in all_vehicles:
+        for comp in self.vehicle_positions(analysis_df):
             if comp == vehicle_number:
                 continue
             
-            comp_laps = analysis_df[
-                (analysis_df['NUMBER'] == comp) & 
-                (analysis_df['LAP_NUMBER'] <= current_lap)
-            ].tail(5)
+            comp_laps = self.vehicle_laps(analysis_df, comp, current_lap).tail(5)
             
             if len(comp_laps) > 0:
-                comp_laps['lap_seconds'] = comp_laps['LAP_TIME'].apply(parse_time)
+                comp_laps['lap_seconds'] = self.lap_seconds(comp_laps)
                 comp_laps = comp_laps.dropna(subset=['lap_seconds'])
                 if len(comp_laps) > 0:
                     comp_pace = comp_laps['lap_seconds'].mean()
@@ -199,22 +239,12 @@ class RaceStrategyAnalyzer:
         Calculate optimal pit strategy considering both tires and fuel
         Uses real race data to determine best pit window
         """
-        vehicle_laps = analysis_df[analysis_df['NUMBER'] == vehicle_number].copy()
+        vehicle_laps = self.vehicle_laps(analysis_df, vehicle_number)
         
         if len(vehicle_laps) < 5:
             return {'error': 'Insufficient data'}
         
-        # Parse lap times
-        def parse_time(t):
-            try:
-                if ':' in str(t):
-                    parts = str(t).split(':')
-                    return float(parts[0]) * 60 + float(parts[1])
-                return float(t)
-            except:
-                return None
-        
-        vehicle_laps['lap_seconds'] = vehicle_laps['LAP_TIME'].apply(parse_time)
+        vehicle_laps['lap_seconds'] = self.lap_seconds(vehicle_laps)
         vehicle_laps = vehicle_laps.dropna(subset=['lap_seconds'])
         
         # Calculate actual degradation from data
@@ -275,37 +305,37 @@ class RaceStrategyAnalyzer:
         Analyze sector performance using real sector timing data
         Identify strengths and weaknesses
         """
-        vehicle_laps = analysis_df[
-            (analysis_df['NUMBER'] == vehicle_number) & 
-            (analysis_df['LAP_NUMBER'] <= current_lap)
-        ].copy()
+        vehicle_laps = self.vehicle_laps(analysis_df, vehicle_number, current_lap)
         
         if len(vehicle_laps) < 3:
             return {'error': 'Insufficient data'}
         
-        # Get sector times
+        # Get sector times: every statistic of every sector in one aggregation
+        sector_cols = [c for c in ['S1_SECONDS', 'S2_SECONDS', 'S3_SECONDS'] if c in vehicle_laps.columns]
+        if not sector_cols:
+            return {'sectors': {}, 'strongest_sector': None, 'weakest_sector': None}
+        stats = vehicle_laps[sector_cols].agg(['count', 'min', 'max', 'mean', 'std'])
+        last_lap = vehicle_laps.iloc[-1]
+        
         sectors = {}
-        for sector_name in ['S1_SECONDS', 'S2_SECONDS', 'S3_SECONDS']:
-            if sector_name in vehicle_laps.columns:
-                sector_data = vehicle_laps[sector_name].dropna()
-                if len(sector_data) > 0:
-                    sectors[sector_name] = {
-                        'best': float(sector_data.min()),
-                        'worst': float(sector_data.max()),
-                        'average': float(sector_data.mean()),
-                        'current': float(vehicle_laps.iloc[-1][sector_name]) if not pd.isna(vehicle_laps.iloc[-1][sector_name]) else None,
-                        'consistency': float(sector_data.std())
-                    }
-        
-        # Compare to field average
-        all_vehicles = analysis_df[analysis_df['LAP_NUMBER'] <= current_lap]
-        field_sectors = {}
-        
-        for sector_name in ['S1_SECONDS', 'S2_SECONDS', 'S3_SECONDS']:
-            if sector_name in all_vehicles.columns:
-                field_data = all_vehicles[sector_name].dropna()
-                if len(field_data) > 0:
-                    field_sectors[sector_name] = float(field_data.mean())
+        for sector_name in sector_cols:
+            sector_stats = stats[sector_name]
+            if sector_stats['count'] > 0:
+                sectors[sector_name] = {
+                    'best': float(sector_stats['min']),
+                    'worst': float(sector_stats['max']),
+                    'average': float(sector_stats['mean']),
+                    'current': float(last_lap[sector_name]) if not pd.isna(last_lap[sector_name]) else None,
+                    'consistency': float(sector_stats['std'])
+                }
+        
+        # Compare to field average (only the sector columns of the laps so far)
+        field_stats = analysis_df.loc[analysis_df['LAP_NUMBER'] <= current_lap, sector_cols].agg(['count', 'mean'])
+        field_sectors = {
+            sector_name: float(field_stats.at['mean', sector_name])
+            for sector_name in sector_cols
+            if field_stats.at['count', sector_name] > 0
+        }
         
         # Calculate relative performance
         for sector_name in sectors:
@@ -337,21 +367,9 @@ class RaceStrategyAnalyzer:
             return pace_analysis
         
         # Calculate time already elapsed
-        vehicle_laps = analysis_df[
-            (analysis_df['NUMBER'] == vehicle_number) & 
-            (analysis_df['LAP_NUMBER'] <= current_lap)
-        ].copy()
-        
-        def parse_time(t):
-            try:
-                if ':' in str(t):
-                    parts = str(t).split(':')
-                    return float(parts[0]) * 60 + float(parts[1])
-                return float(t)
-            except:
-                return None
-        
-        vehicle_laps['lap_seconds'] = vehicle_laps['LAP_TIME'].apply(parse_time)
+        vehicle_laps = self.vehicle_laps(analysis_df, vehicle_number, current_lap)
+        
+        vehicle_laps['lap_seconds'] = self.lap_seconds(vehicle_laps)
         vehicle_laps = vehicle_laps.dropna(subset=['lap_seconds'])
         
         time_elapsed = vehicle_laps['lap_seconds'].sum()
@@ -386,12 +404,18 @@ class RaceStrategyAnalyzer:
 
 if __name__ == "__main__":
     # Test race strategy analysis
+    import os
     import sys
-    sys.path.append('.')
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.path.insert(0, project_root)
     from src.data_loader import RaceDataLoader
     
-    loader = RaceDataLoader()
-    analysis = loader.load_analysis_endurance(race_num=1)
+    loader = RaceDataLoader(os.path.join(project_root, 'barber'))
+    # Only the columns the strategy analysis reads
+    analysis = loader.load_analysis_endurance(
+        race_num=1,
+        columns=['NUMBER', 'LAP_NUMBER', 'LAP_TIME', 'S1_SECONDS', 'S2_SECONDS', 'S3_SECONDS', 'KPH']
+    )
     
     analyzer = RaceStrategyAnalyzer()
     
@@ -205,11 +205,13 @@ class RacingLineAnalyzer:
 
 if __name__ == "__main__":
     # Test racing line analysis
+    import os
     import sys
-    sys.path.append('.')
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.path.insert(0, project_root)
     from src.data_loader import RaceDataLoader
     
-    loader = RaceDataLoader()
+    loader = RaceDataLoader(os.path.join(project_root, 'barber'))
     analysis = loader.load_analysis_endurance(race_num=1)
     
     analyzer = RacingLineAnalyzer()
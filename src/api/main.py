@@ -4,13 +4,15 @@ FastAPI backend for serving race analytics
 Multi-track support for all 7 Toyota GR Cup circuits
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
+import hashlib
 import sys
 import os
+from urllib.parse import unquote
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -21,7 +23,7 @@ from src.analysis.racing_line import RacingLineAnalyzer
 from src.analysis.race_strategy import RaceStrategyAnalyzer
 from src.multi_track_loader import MultiTrackLoader
 from src.track_config import list_available_tracks, get_track_info, get_all_tracks_summary
-import json
+import orjson
 import re
 
 app = FastAPI(
@@ -54,11 +56,15 @@ barber_path = None
 race_results = None
 lap_times = None
 analysis_data = None
+# Version of the race data loaded at startup, for the ETags of endpoints derived from it
+data_etag = None
 rag_dataset = []
+# Lowercased (question, answer) per RAG entry, parallel to rag_dataset, for keyword search
+rag_search_text = []
 
 @app.on_event("startup")
 async def startup_event():
-    global race_results, lap_times, analysis_data, rag_dataset, loader, multi_loader, data_root, barber_path
+    global race_results, lap_times, analysis_data, data_etag, rag_dataset, rag_search_text, loader, multi_loader, data_root, barber_path
     
     print("🏁 RaceIQ API Starting...")
     
@@ -89,6 +95,10 @@ async def startup_event():
             race_results = loader.load_race_results(race_num=1)
             lap_times = loader.load_lap_times(race_num=1)
             analysis_data = loader.load_analysis_endurance(race_num=1)
+            data_etag = file_version_etag(files=sorted(
+                entry.path for entry in os.scandir(barber_path)
+                if entry.is_file() and entry.name.lower().endswith('.csv')
+            ))
             print(f"✅ Data loaded: {len(race_results)} vehicles, {len(lap_times)} laps")
         else:
             print(f"⚠️  No data files found in {barber_path}")
@@ -100,8 +110,9 @@ async def startup_event():
     try:
         rag_path = os.path.join(data_root, 'rag_dataset/race_engineer_enhanced.jsonl')
         if os.path.exists(rag_path):
-            with open(rag_path, 'r', encoding='utf-8') as f:
-                rag_dataset = [json.loads(line) for line in f]
+            with open(rag_path, 'rb') as f:
+                rag_dataset = [orjson.loads(line) for line in f]
+            rag_search_text = [(entry['question'].lower(), entry['answer'].lower()) for entry in rag_dataset]
             print(f"✅ Loaded {len(rag_dataset)} AI knowledge entries")
         else:
             print(f"⚠️  RAG dataset not found")
@@ -127,6 +138,55 @@ class AIQueryRequest(BaseModel):
     context: Optional[Dict] = None
 
 
+class BatchRequestItem(BaseModel):
+    method: str = "GET"
+    url: str
+    body: Optional[Any] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+# ============================================================================
+# HTTP CACHING
+# ============================================================================
+
+def file_version_etag(*labels, files: Optional[List[str]] = None) -> str:
+    """
+    ETag for a response derived from data files
+    
+    labels contribute their repr; only the paths in files are stat'ed, each
+    contributing its path, mtime and size (not its content), so the tag
+    changes whenever an input file does. A missing file counts as such.
+    """
+    digest = hashlib.md5()
+    for label in labels:
+        digest.update(repr(label).encode())
+        digest.update(b'\0')
+    for path in files or ():
+        try:
+            stat = os.stat(path)
+            version = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            version = f"{path}:missing"
+        digest.update(version.encode())
+        digest.update(b'\0')
+    return f'"{digest.hexdigest()}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Tag the response; a 304 to return instead when the client's If-None-Match already matches"""
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+# The track list is static configuration; it changes only with track_config.py
+TRACKS_ETAG = file_version_etag("tracks", files=[sys.modules[get_track_info.__module__].__file__])
+
+
 @app.get("/")
 async def root():
     return {
@@ -147,12 +207,27 @@ async def root():
     }
 
 
+@app.get("/health")
+@app.get("/healthz")
+async def health_check():
+    """Cheap liveness probe: answers without touching any data"""
+    return {
+        "status": "ok",
+        "data_loaded": analysis_data is not None,
+        "rag_entries": len(rag_dataset)
+    }
+
+
 @app.get("/vehicles")
-async def get_vehicles():
+async def get_vehicles(request: Request, response: Response):
     """Get list of all vehicles in the race"""
     if race_results is None:
         raise HTTPException(status_code=503, detail="Data not loaded")
     
+    cached = not_modified(request, response, file_version_etag("vehicles", data_etag))
+    if cached is not None:
+        return cached
+    
     vehicles = []
     for _, row in race_results.iterrows():
         vehicles.append({
@@ -183,11 +258,15 @@ async def predict_pit_window(request: PitPredictionRequest):
 
 
 @app.get("/tire-degradation/{vehicle_number}")
-async def get_tire_degradation(vehicle_number: int):
+async def get_tire_degradation(vehicle_number: int, request: Request, response: Response):
     """Get detailed tire degradation analysis"""
     if analysis_data is None:
         raise HTTPException(status_code=503, detail="Data not loaded")
     
+    cached = not_modified(request, response, file_version_etag("tire-degradation", vehicle_number, data_etag))
+    if cached is not None:
+        return cached
+    
     degradation = tire_analyzer.analyze_lap_degradation(analysis_data, vehicle_number)
     
     if len(degradation) == 0:
@@ -383,10 +462,8 @@ def find_relevant_knowledge(query: str, context: Optional[Dict] = None, top_k: i
     
     # Score each entry
     scored_entries = []
-    for entry in rag_dataset:
+    for entry, (question_lower, answer_lower) in zip(rag_dataset, rag_search_text):
         score = 0
-        question_lower = entry['question'].lower()
-        answer_lower = entry['answer'].lower()
         
         # Keyword matching
         for keyword in keywords:
@@ -397,9 +474,10 @@ def find_relevant_knowledge(query: str, context: Optional[Dict] = None, top_k: i
         
         # Context matching
         if context:
-            if 'track' in context and entry['context'].get('track') == context['track']:
+            entry_context = entry['context']
+            if 'track' in context and entry_context.get('track') == context['track']:
                 score += 5
-            if 'category' in context and entry['context'].get('category') == context.get('category'):
+            if 'category' in context and entry_context.get('category') == context.get('category'):
                 score += 3
         
         if score > 0:
@@ -521,8 +599,11 @@ async def ai_race_engineer(request: AIQueryRequest):
 # ============================================================================
 
 @app.get("/tracks")
-async def get_tracks():
+async def get_tracks(request: Request, response: Response):
     """Get list of all available tracks"""
+    cached = not_modified(request, response, TRACKS_ETAG)
+    if cached is not None:
+        return cached
     return {
         "tracks": list_available_tracks(),
         "summary": get_all_tracks_summary()
@@ -683,11 +764,19 @@ async def get_track_map(track_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tracks/{track_name}/geometry")
-async def get_track_geometry(track_name: str, race_num: int = 1):
+async def get_track_geometry(track_name: str, request: Request, response: Response, race_num: int = 1):
     """Get 3D track geometry from GPS telemetry data"""
     try:
         from src.analysis.track_geometry import get_cached_track_geometry
         
+        # Geometry is derived from the race's telemetry file; a client with the
+        # current version skips the extraction entirely
+        telemetry_file = multi_loader.get_telemetry_file(track_name, race_num) if multi_loader else None
+        cached = not_modified(request, response, file_version_etag(
+            "geometry", track_name, race_num, files=[telemetry_file] if telemetry_file else None))
+        if cached is not None:
+            return cached
+        
         geometry = get_cached_track_geometry(track_name, race_num)
         
         return {
@@ -805,6 +894,18 @@ async def get_optimal_telemetry(track_name: str, race_num: int, lap: Optional[in
 async def get_telemetry_comparison(track_name: str, race_num: int, vehicle_number: int, lap: int):
     """Compare vehicle telemetry against optimal"""
     try:
+        from src.telemetry_processor import get_telemetry_processor
+        
+        # Both laps come from the same telemetry file: extract them in one
+        # pass so the two lookups below are served from the lap cache
+        telemetry_file = multi_loader.get_telemetry_file(track_name, race_num)
+        if telemetry_file:
+            processor = get_telemetry_processor()
+            fastest_lap = processor.find_fastest_lap(multi_loader.load_analysis(track_name, race_num))
+            if fastest_lap is not None:
+                processor.process_many_laps(telemetry_file, [lap, int(fastest_lap['LAP_NUMBER'])],
+                                            track_name, race_num, sample_rate=50)
+        
         # Get current vehicle telemetry
         current = await get_live_telemetry(track_name, race_num, vehicle_number, lap)
         
@@ -848,6 +949,101 @@ async def get_telemetry_comparison(track_name: str, race_num: int, vehicle_numbe
         raise HTTPException(status_code=500, detail=f"Error comparing telemetry: {str(e)}")
 
 
+# ============================================================================
+# BATCH ENDPOINT
+# ============================================================================
+
+# Describe the outer request's body and connection, not a sub-request's
+_UNFORWARDED_HEADERS = {'host', 'content-type', 'content-length', 'transfer-encoding',
+                        'connection', 'accept-encoding'}
+
+
+async def dispatch_in_process(method: str, url: str, body: Optional[Any] = None,
+                              headers: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    Run one API request through the app in-process (no socket, no HTTP framing)
+    
+    headers (e.g. If-None-Match) are passed on to the endpoint. A request
+    that raises is reported as a 500 with no body.
+    """
+    path, _, query = url.partition('?')
+    payload = orjson.dumps(body) if body is not None else b''
+    scope_headers = [(b'host', b'raceiq-batch')]
+    scope_headers += [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                      for name, value in (headers or {}).items()
+                      if name.lower() not in _UNFORWARDED_HEADERS]
+    if payload:
+        scope_headers += [(b'content-type', b'application/json'), (b'content-length', str(len(payload)).encode())]
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method.upper(),
+        'scheme': 'http',
+        # ASGI wants the decoded path; raw_path keeps the URL as sent
+        'path': unquote(path),
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': scope_headers,
+        'client': None,
+        'server': None,
+    }
+    
+    request_sent = False
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {'type': 'http.disconnect'}
+        request_sent = True
+        return {'type': 'http.request', 'body': payload, 'more_body': False}
+    
+    status = 500
+    content_type = b''
+    chunks = []
+    async def send(message):
+        nonlocal status, content_type
+        if message['type'] == 'http.response.start':
+            status = message['status']
+            content_type = dict(message.get('headers', [])).get(b'content-type', b'')
+        elif message['type'] == 'http.response.body':
+            chunks.append(message.get('body', b''))
+    
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error middleware has already sent its 500 and re-raises;
+        # keep the failure to this item
+        return {"method": method.upper(), "url": url, "status": 500, "body": None}
+    
+    content = b''.join(chunks)
+    # Non-JSON responses (e.g. track map images) are reported without a body
+    data = orjson.loads(content) if content and content_type.startswith(b'application/json') else None
+    return {"method": method.upper(), "url": url, "status": status, "body": data}
+
+
+@app.post("/api/batch")
+async def batch_requests(items: List[BatchRequestItem], request: Request):
+    """
+    Run several API requests in one round trip
+    
+    Body: [{"method": "GET", "url": "/vehicles"}, {"method": "POST", "url": "/coaching", "body": {...}}]
+    Each request gets the batch request's headers, overridden by its own
+    optional "headers". Returns one {method, url, status, body} per request,
+    in order.
+    """
+    if any(unquote(item.url.partition('?')[0]).rstrip('/') == '/api/batch' for item in items):
+        raise HTTPException(status_code=400, detail="Batch requests cannot be nested")
+    
+    outer_headers = dict(request.headers)
+    results = []
+    for item in items:
+        item_headers = {name.lower(): value for name, value in (item.headers or {}).items()}
+        results.append(await dispatch_in_process(item.method, item.url, item.body,
+                                                 {**outer_headers, **item_headers}))
+    return results
+
+
 def calculate_performance_score(speed_delta: float, throttle_delta: float, brake_delta: float) -> float:
     """Calculate performance score (0-100) based on deltas"""
     # Closer to optimal = higher score
@@ -8,8 +8,9 @@ import seaborn as sns
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import os
 import sys
-sys.path.append('.')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.data_loader import RaceDataLoader
 from src.analysis.tire_degradation import TireDegradationAnalyzer
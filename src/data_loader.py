@@ -3,11 +3,16 @@ Data loading utilities for RaceIQ
 Handles CSV parsing with proper delimiters and data cleaning
 """
 
+import os
 import pandas as pd
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import warnings
 
+from src.multi_track_loader import parquet_sidecar_path, restore_missing_as_nan
+
 warnings.filterwarnings('ignore')
 
 
@@ -74,24 +79,25 @@ class RaceDataLoader:
         
         return df
     
-    def load_analysis_endurance(self, race_num: int = 1) -> pd.DataFrame:
-        """Load detailed lap analysis with sector times (semicolon delimited)"""
+    def load_analysis_endurance(self, race_num: int = 1, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load detailed lap analysis with sector times (semicolon delimited)
+        
+        columns projects the read to just those columns (lap_time_seconds is
+        still added when LAP_TIME is among them); columns a file doesn't have
+        are left out.
+        """
         pattern = f"23_*Race {race_num}*.CSV"
         files = list(self.data_dir.glob(pattern))
         
         if not files:
             raise FileNotFoundError(f"No analysis file found for race {race_num}")
         
-        df = pd.read_csv(files[0], delimiter=';', encoding='utf-8')
-        
-        # Clean column names (remove leading/trailing spaces)
-        df.columns = df.columns.str.strip()
-        
-        # Convert time strings to seconds
-        if 'LAP_TIME' in df.columns:
-            df['lap_time_seconds'] = df['LAP_TIME'].apply(self._time_to_seconds)
-        
-        return df
+        # Parsed once per file version; callers get their own copy
+        stat = os.stat(files[0])
+        key_columns = tuple(columns) if columns else None
+        return _load_analysis_endurance(str(files[0].resolve()), key_columns,
+                                        stat.st_mtime_ns, stat.st_size).copy()
     
     @staticmethod
     def _time_to_seconds(time_str: str) -> float:
@@ -108,6 +114,25 @@ class RaceDataLoader:
         except:
             return None
     
+    @staticmethod
+    def times_to_seconds(times: pd.Series) -> pd.Series:
+        """Vectorized _time_to_seconds over a column; NaN where it would return None"""
+        if pd.api.types.infer_dtype(times, skipna=True) != 'string':
+            # Non-string values (never parseable by _time_to_seconds) or an all-NaN column
+            return pd.to_numeric(times.map(RaceDataLoader._time_to_seconds), errors='coerce').astype('float64')
+        
+        parts = times.str.split(':', expand=True).reindex(columns=range(3))
+        minutes_seconds = parts[1].notna() & parts[2].isna()
+        # int() minutes, float() seconds; anything else is left for the scalar parse
+        minutes = pd.to_numeric(parts[0].where(parts[0].str.fullmatch(r'\s*[+-]?\d+\s*', na=False)), errors='coerce')
+        seconds = (minutes * 60 + pd.to_numeric(parts[1], errors='coerce')).where(
+            minutes_seconds, pd.to_numeric(times.where(parts[1].isna()), errors='coerce'))
+        
+        unparsed = seconds.isna() & times.notna()
+        if unparsed.any():
+            seconds[unparsed] = pd.to_numeric(times[unparsed].map(RaceDataLoader._time_to_seconds), errors='coerce')
+        return seconds.astype('float64')
+    
     def get_vehicle_laps(self, lap_times_df: pd.DataFrame, vehicle_number: int) -> pd.DataFrame:
         """Get all laps for a specific vehicle"""
         return lap_times_df[lap_times_df['vehicle_number'] == vehicle_number].copy()
@@ -120,6 +145,48 @@ class RaceDataLoader:
         return vehicle_laps.loc[vehicle_laps['lap_time_seconds'].idxmin()]
 
 
+def _read_analysis_table(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Raw analysis table, from its Parquet sidecar while that is up to date
+    
+    Sidecars are only read here, never written; they come from an explicit
+    MultiTrackLoader.build_parquet_cache run. The CSV stays the source of
+    truth: a sidecar older than it is ignored. columns projects either read.
+    """
+    wanted = frozenset(columns) if columns is not None else None
+    sidecar = parquet_sidecar_path(path)
+    try:
+        if os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            present = None
+            if wanted is not None:
+                present = [name for name in pq.read_schema(sidecar).names if name in wanted]
+            return restore_missing_as_nan(pd.read_parquet(sidecar, columns=present))
+    except (OSError, ValueError):
+        pass
+    
+    # The exports pad header names, so project on the stripped names
+    usecols = (lambda name: name.strip() in wanted) if wanted is not None else None
+    df = pd.read_csv(path, delimiter=';', encoding='utf-8', usecols=usecols)
+    
+    # Clean column names (remove leading/trailing spaces)
+    df.columns = df.columns.str.strip()
+    
+    return df
+
+
+@lru_cache(maxsize=8)
+def _load_analysis_endurance(path: str, columns: Optional[Tuple[str, ...]],
+                             mtime_ns: int, size: int) -> pd.DataFrame:
+    # Keyed on mtime and size so an updated export is parsed again
+    df = _read_analysis_table(path, list(columns) if columns else None)
+    
+    # Convert time strings to seconds, once per load rather than per analysis
+    if 'LAP_TIME' in df.columns:
+        df['lap_time_seconds'] = RaceDataLoader.times_to_seconds(df['LAP_TIME'])
+    
+    return df
+
+
 if __name__ == "__main__":
     # Test data loading
     loader = RaceDataLoader()
@@ -5,11 +5,18 @@ Works on AWS or any cloud platform
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 # GCS bucket with public access
 GCS_BUCKET_BASE = "https://storage.googleapis.com/raceiq-data-bucket"
 
+# Every file comes from the same host, so one keep-alive session reuses the
+# connection (and TLS handshake) across downloads
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 # Files to download
 DATA_FILES = {
     'barber': [
@@ -35,21 +42,30 @@ DATA_FILES = {
 
 
 def download_file(url: str, local_path: str) -> bool:
-    """Download a file from URL to local path"""
+    """Download a file from URL to local path (skipped if it was already downloaded)"""
     try:
+        # The bucket's files don't change, so a local copy is never refetched
+        if os.path.exists(local_path):
+            return True
+        
         # Create directory if it doesn't exist
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Download file
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         
-        # Save to local file
-        with open(local_path, 'wb') as f:
+        # Save to a temporary name first, so an interrupted download never
+        # leaves a truncated file that would count as downloaded
+        partial_path = local_path + '.part'
+        with open(partial_path, 'wb') as f:
             f.write(response.content)
+        os.replace(partial_path, local_path)
         
         return True
-    except Exception as e:
+    except (requests.RequestException, OSError) as e:
+        # Network/HTTP errors and local write failures count as a failed
+        # download; anything else is a bug and propagates
         print(f"Failed to download {url}: {e}")
         return False
 
@@ -59,25 +75,26 @@ def download_all_data(base_path: str = "/tmp/raceiq_data") -> bool:
     
     print(f"📥 Downloading race data to {base_path}...")
     
-    success_count = 0
-    total_count = 0
+    # (folder, filename, GCS URL, local path) for every file
+    jobs = [
+        (folder, filename, f"{GCS_BUCKET_BASE}/{folder}/{filename}", os.path.join(base_path, folder, filename))
+        for folder, files in DATA_FILES.items()
+        for filename in files
+    ]
+    
+    # Downloads wait on the network, so run them concurrently over the
+    # shared session; results come back in job order for the report
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda job: download_file(job[2], job[3]), jobs))
     
-    for folder, files in DATA_FILES.items():
-        for filename in files:
-            total_count += 1
-            
-            # Construct GCS URL
-            gcs_url = f"{GCS_BUCKET_BASE}/{folder}/{filename}"
-            
-            # Local path
-            local_path = os.path.join(base_path, folder, filename)
-            
-            # Download
-            if download_file(gcs_url, local_path):
-                success_count += 1
-                print(f"  ✅ {folder}/{filename}")
-            else:
-                print(f"  ❌ {folder}/{filename}")
+    success_count = 0
+    total_count = len(jobs)
+    for (folder, filename, _, _), ok in zip(jobs, results):
+        if ok:
+            success_count += 1
+            print(f"  ✅ {folder}/{filename}")
+        else:
+            print(f"  ❌ {folder}/{filename}")
     
     print(f"\n📊 Downloaded {success_count}/{total_count} files")
     return success_count == total_count
@@ -6,6 +6,7 @@ Produces high-quality, structured data for AI race engineer training
 import json
 import sys
 import os
+from collections import Counter, defaultdict
 from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +23,8 @@ class CleanRAGDataGenerator:
         self.tracks = list_available_tracks()
         self.dataset = []
         self.entry_id = 1
+        # One timestamp per run, shared by every entry and the stats file
+        self.generated_at = datetime.now().isoformat()
     
     def generate_all_datasets(self):
         """Generate all RAG datasets"""
@@ -62,7 +65,7 @@ class CleanRAGDataGenerator:
                 "source": "toyota_gr_cup_2025",
                 "domain": "motorsports_race_engineering",
                 "verified": True,
-                "created": datetime.now().isoformat()
+                "created": self.generated_at
             }
         }
         self.dataset.append(entry)
@@ -107,7 +110,7 @@ class CleanRAGDataGenerator:
                     difficulty="advanced"
                 )
         
-        print(f"  ✓ Generated {len([e for e in self.dataset if e['context']['category'] == 'track_info'])} track entries")
+        print(f"  ✓ Generated {sum(1 for e in self.dataset if e['context']['category'] == 'track_info')} track entries")
     
     def generate_telemetry_insights(self):
         """Generate telemetry parameter knowledge"""
@@ -393,30 +396,31 @@ class CleanRAGDataGenerator:
         with open('rag_dataset/race_engineer_qa.json', 'w', encoding='utf-8') as f:
             json.dump(self.dataset, f, indent=2, ensure_ascii=False)
         
-        # Save by category
-        categories = {}
+        # Save by category, keeping only the counts once each file is written
+        categories = defaultdict(list)
+        difficulty_counts = Counter()
         for entry in self.dataset:
-            cat = entry['context']['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(entry)
+            ctx = entry['context']
+            categories[ctx['category']].append(entry)
+            difficulty_counts[ctx['difficulty']] += 1
         
-        for cat, entries in categories.items():
+        category_counts = {}
+        for cat in list(categories):
+            entries = categories.pop(cat)
             filename = f'rag_dataset/{cat}_knowledge.json'
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(entries, f, indent=2, ensure_ascii=False)
+            category_counts[cat] = len(entries)
         
         # Save statistics
         stats = {
             "total_entries": len(self.dataset),
-            "categories": {cat: len(entries) for cat, entries in categories.items()},
+            "categories": category_counts,
             "difficulty_levels": {
-                "beginner": len([e for e in self.dataset if e['context']['difficulty'] == 'beginner']),
-                "intermediate": len([e for e in self.dataset if e['context']['difficulty'] == 'intermediate']),
-                "advanced": len([e for e in self.dataset if e['context']['difficulty'] == 'advanced'])
+                level: difficulty_counts[level] for level in ('beginner', 'intermediate', 'advanced')
             },
             "tracks_covered": len(self.tracks),
-            "generated_date": datetime.now().isoformat()
+            "generated_date": self.generated_at
         }
         
         with open('rag_dataset/dataset_stats.json', 'w', encoding='utf-8') as f:
@@ -424,7 +428,7 @@ class CleanRAGDataGenerator:
         
         print(f"\n📊 Dataset Statistics:")
         print(f"  Total entries: {stats['total_entries']}")
-        print(f"  Categories: {len(categories)}")
+        print(f"  Categories: {len(category_counts)}")
         print(f"  Difficulty levels: {stats['difficulty_levels']}")
 
 
@@ -3,14 +3,17 @@ Enhanced RAG Dataset Generator with Advanced Racing Knowledge
 Incorporates professional-level insights on driver development, team operations, and data analysis
 """
 
-import json
+import logging
 import sys
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from generate_full_rag_dataset import FullRAGDatasetGenerator
+from src.generate_full_rag_dataset import (DIFFICULTY_LEVELS, FullRAGDatasetGenerator, configure_logging,
+                                           dump_json, dump_jsonl, dump_parquet)
+
+logger = logging.getLogger(__name__)
 
 
 class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
@@ -18,12 +21,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
     
     def generate_complete_dataset(self):
         """Generate complete dataset with enhanced content"""
-        print("🏁 Generating Enhanced Multi-Track RAG Dataset")
-        print("=" * 70)
+        logger.info("🏁 Generating Enhanced Multi-Track RAG Dataset")
+        logger.info("=" * 70)
         
         # Process each track (from parent class)
-        for track_name in self.tracks:
-            self.process_track(track_name)
+        self.process_tracks()
         
         # Add expert knowledge (from parent class)
         self.add_expert_knowledge()
@@ -39,12 +41,21 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
         # Save all datasets
         self.save_datasets()
         
-        print(f"\n✅ Generated {len(self.dataset)} enhanced RAG entries")
-        print(f"📊 Stats: {self.stats}")
+        logger.info(f"\n✅ Generated {len(self.dataset)} enhanced RAG entries")
+        logger.info(f"📊 Stats: {self.stats}")
+    
+    def _add_topics(self, topics, category):
+        """Add (topic, question, answer) tuples as one batch of professional knowledge"""
+        make_entry = self._make_entry
+        self.add_entries([
+            make_entry(question, answer, category, topic.lower().replace(" ", "_"),
+                       difficulty="advanced", data_source="professional_knowledge")
+            for topic, question, answer in topics
+        ])
     
     def add_driver_development_knowledge(self):
         """Add advanced driver development insights"""
-        print("\n🎓 Adding driver development knowledge...")
+        logger.info("\n🎓 Adding driver development knowledge...")
         
         development_topics = [
             ("Continuous Development", 
@@ -68,19 +79,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "Effective simulator use accelerates development: 1) Learn new tracks - Build muscle memory for corners and braking points before arriving. 2) Practice conditions - Experience rain, night, different temperatures. 3) Setup testing - Try setup changes without using track time. 4) Race craft - Practice overtaking, defending, and racecraft scenarios. 5) Consistency work - Focus on repeatable laps, not just fast laps. The simulator is a tool for deliberate practice, not just entertainment. Treat it seriously for maximum benefit.")
         ]
         
-        for topic, question, answer in development_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="driver_development",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(development_topics, category="driver_development")
     
     def add_team_operations_knowledge(self):
         """Add team operations and strategy insights"""
-        print("\n👥 Adding team operations knowledge...")
+        logger.info("\n👥 Adding team operations knowledge...")
         
         team_topics = [
             ("Race Strategy Planning",
@@ -104,19 +107,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "The engineer-driver relationship is critical: 1) Trust building - Develop mutual respect and understanding over time. 2) Communication style - Learn how the driver prefers to receive information (detailed vs concise). 3) Setup philosophy - Understand driver preferences (stable vs responsive, understeer vs oversteer). 4) Race management - Provide calm, clear instructions during high-pressure moments. 5) Development focus - For young drivers, balance performance with learning and growth. A strong engineer-driver partnership can find 0.5-1.0s per lap through better communication and setup.")
         ]
         
-        for topic, question, answer in team_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="team_operations",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(team_topics, category="team_operations")
     
     def add_coaching_knowledge(self):
         """Add advanced coaching and technical knowledge"""
-        print("\n🏫 Adding advanced coaching knowledge...")
+        logger.info("\n🏫 Adding advanced coaching knowledge...")
         
         coaching_topics = [
             ("Technical Feedback Analysis",
@@ -140,19 +135,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "In-race coaching requires special skills: 1) Calm tone - Keep voice steady even in critical moments. 2) Concise messages - Drivers can't process long explanations while racing. 3) Timing - Give info at appropriate moments (not mid-corner). 4) Prioritize - Focus on most important information only. 5) Positive reinforcement - Acknowledge good performance. 6) Strategic updates - Gaps, pit windows, competitor positions. 7) Emergency clarity - In incidents, give clear, direct instructions. Example: 'Gap 2.5 seconds, push for 3 laps then pit' vs long explanation. Clear, calm communication helps drivers perform under pressure.")
         ]
         
-        for topic, question, answer in coaching_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="coaching_advanced",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(coaching_topics, category="coaching_advanced")
     
     def add_advanced_weather_knowledge(self):
         """Add detailed weather impact knowledge"""
-        print("\n🌦️ Adding advanced weather knowledge...")
+        logger.info("\n🌦️ Adding advanced weather knowledge...")
         
         weather_topics = [
             ("Rain and Wet Conditions Impact",
@@ -177,19 +164,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "Tire strategy in mixed conditions is critical: 1) Track wetness assessment - Full wets for standing water, intermediates for damp, slicks for dry. 2) Timing the switch - Too early to slicks = no grip and tire damage. Too late = losing 2-3 seconds per lap. 3) Track drying patterns - Some corners dry faster (sun exposure, wind, racing line). 4) Risk vs reward - Leading: Conservative approach. Mid-pack: Can gamble for positions. 5) Weather radar - Monitor approaching rain to time pit stops. 6) Competitor watching - See what others do, learn from their mistakes. One perfect tire call can win a race; one bad call can lose it. This is where experience and data analysis combine.")
         ]
         
-        for topic, question, answer in weather_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="weather_advanced",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(weather_topics, category="weather_advanced")
     
     def add_data_analysis_knowledge(self):
         """Add quantitative metrics and data analysis knowledge"""
-        print("\n📊 Adding data analysis knowledge...")
+        logger.info("\n📊 Adding data analysis knowledge...")
         
         data_topics = [
             ("Speed Execution Analysis",
@@ -213,19 +192,11 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "Key junior racing metrics include: 1) Win ratio - Wins divided by races entered. Elite: >20%, Good: 10-20%. 2) Podium rate - Top 3 finishes percentage. Consistent performers: >40%. 3) Pole position rate - Qualifying performance indicator. >15% shows raw speed. 4) Points per race - Average points scored. Accounts for consistency and speed. 5) Teammate comparison - Head-to-head qualifying and race results vs teammate. Should win >60%. 6) Incident rate - Crashes and penalties per race. Lower is better. 7) Wet weather performance - Specific wet race results. Separates talent. These stats help teams identify promising talent for development programs.")
         ]
         
-        for topic, question, answer in data_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="data_analysis",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(data_topics, category="data_analysis")
     
     def add_performance_metrics_knowledge(self):
         """Add performance measurement and benchmarking knowledge"""
-        print("\n📈 Adding performance metrics knowledge...")
+        logger.info("\n📈 Adding performance metrics knowledge...")
         
         metrics_topics = [
             ("Telemetry Data Points",
@@ -249,117 +220,80 @@ class EnhancedRAGDatasetGenerator(FullRAGDatasetGenerator):
              "Systematic post-session review: 1) Initial overview - Review lap times, sector times, incidents. Identify patterns. 2) Telemetry comparison - Overlay driver vs reference lap. Find specific areas of time loss. 3) Video correlation - Match telemetry to video. See what driver is doing differently. 4) Driver debrief - Discuss findings with driver. Get their perspective on car behavior. 5) Setup correlation - Determine if setup changes had desired effect. 6) Action items - Create specific list of improvements for next session. 7) Documentation - Record findings for future reference. Thorough analysis between sessions is crucial for continuous improvement. Teams that analyze well improve faster.")
         ]
         
-        for topic, question, answer in metrics_topics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="performance_metrics",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="professional_knowledge"
-            )
+        self._add_topics(metrics_topics, category="performance_metrics")
     
     def save_datasets(self):
         """Save enhanced datasets"""
-        print("\n💾 Saving enhanced datasets...")
+        logger.info("\n💾 Saving enhanced datasets...")
         
         # Create output directory
         os.makedirs('rag_dataset', exist_ok=True)
         
-        # Save JSONL (for training)
-        with open('rag_dataset/race_engineer_enhanced.jsonl', 'w', encoding='utf-8') as f:
-            for entry in self.dataset:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-        print("  ✓ Saved race_engineer_enhanced.jsonl")
-        
-        # Save JSON (for review)
-        with open('rag_dataset/race_engineer_enhanced.json', 'w', encoding='utf-8') as f:
-            json.dump(self.dataset, f, indent=2, ensure_ascii=False)
-        print("  ✓ Saved race_engineer_enhanced.json")
-        
-        # Save by category
-        categories = {}
-        for entry in self.dataset:
-            cat = entry['context']['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(entry)
-        
-        for cat, entries in categories.items():
-            filename = f'rag_dataset/{cat}_enhanced.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
-        print(f"  ✓ Saved {len(categories)} category files")
-        
-        # Save by track
-        tracks = {}
-        for entry in self.dataset:
-            track = entry['context'].get('track')
-            if track:
-                if track not in tracks:
-                    tracks[track] = []
-                tracks[track].append(entry)
-        
-        for track, entries in tracks.items():
-            filename = f'rag_dataset/track_{track}_enhanced.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
-        print(f"  ✓ Saved {len(tracks)} track-specific files")
+        # The outputs are independent, so encode and write them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # JSONL (for training), JSON (for review), Parquet (for columnar consumers)
+            jsonl = executor.submit(dump_jsonl, self.dataset, 'rag_dataset/race_engineer_enhanced.jsonl')
+            review = executor.submit(dump_json, self.dataset, 'rag_dataset/race_engineer_enhanced.json') if self.emit_pretty else None
+            parquet = executor.submit(dump_parquet, self.dataset, 'rag_dataset/race_engineer_enhanced.parquet')
+            # By category and by track, counting everything in the same pass
+            shards = executor.submit(self._write_shards, 'rag_dataset/{}_enhanced.jsonl', 'rag_dataset/track_{}_enhanced.jsonl')
+            
+            jsonl.result()
+            logger.info("  ✓ Saved race_engineer_enhanced.jsonl")
+            if review:
+                review.result()
+                logger.info("  ✓ Saved race_engineer_enhanced.json")
+            parquet.result()
+            logger.info("  ✓ Saved race_engineer_enhanced.parquet")
+            categories, tracks, difficulty_counts, source_counts = shards.result()
+        logger.info(f"  ✓ Saved {len(categories)} category files")
+        logger.info(f"  ✓ Saved {len(tracks)} track-specific files")
         
         # Save statistics
         stats = {
             "total_entries": len(self.dataset),
             "processing_stats": self.stats,
-            "categories": {cat: len(entries) for cat, entries in categories.items()},
-            "tracks": {track: len(entries) for track, entries in tracks.items()},
-            "difficulty_levels": {
-                "beginner": len([e for e in self.dataset if e['context']['difficulty'] == 'beginner']),
-                "intermediate": len([e for e in self.dataset if e['context']['difficulty'] == 'intermediate']),
-                "advanced": len([e for e in self.dataset if e['context']['difficulty'] == 'advanced'])
-            },
-            "data_sources": {},
-            "generated_date": datetime.now().isoformat()
+            "categories": dict(categories),
+            "tracks": dict(tracks),
+            "difficulty_levels": {level: difficulty_counts[level] for level in DIFFICULTY_LEVELS},
+            "data_sources": dict(source_counts),
+            "generated_date": self.generated_at
         }
         
-        # Count data sources
-        for entry in self.dataset:
-            source = entry['context']['data_source']
-            stats['data_sources'][source] = stats['data_sources'].get(source, 0) + 1
-        
-        with open('rag_dataset/enhanced_dataset_stats.json', 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
-        print("  ✓ Saved enhanced_dataset_stats.json")
+        dump_json(stats, 'rag_dataset/enhanced_dataset_stats.json')
+        logger.info("  ✓ Saved enhanced_dataset_stats.json")
         
-        print(f"\n📊 Final Statistics:")
-        print(f"  Total entries: {stats['total_entries']}")
-        print(f"  Tracks processed: {self.stats['tracks_processed']}")
-        print(f"  Races processed: {self.stats['races_processed']}")
-        print(f"  Files analyzed: {self.stats['files_analyzed']}")
-        print(f"  Categories: {len(categories)}")
-        print(f"  Difficulty levels: {stats['difficulty_levels']}")
+        logger.info(f"\n📊 Final Statistics:")
+        logger.info(f"  Total entries: {stats['total_entries']}")
+        logger.info(f"  Tracks processed: {self.stats['tracks_processed']}")
+        logger.info(f"  Races processed: {self.stats['races_processed']}")
+        logger.info(f"  Files analyzed: {self.stats['files_analyzed']}")
+        logger.info(f"  Categories: {len(categories)}")
+        logger.info(f"  Difficulty levels: {stats['difficulty_levels']}")
 
 
 def main():
-    print("🏁 Toyota GR Cup Enhanced RAG Dataset Generator")
-    print("=" * 70)
-    print("Extracting data from all 7 tracks and 14 races...")
-    print("Adding professional-level racing knowledge...")
-    print()
+    configure_logging(logging.WARNING if '--quiet' in sys.argv else logging.INFO)
+    logger.info("🏁 Toyota GR Cup Enhanced RAG Dataset Generator")
+    logger.info("=" * 70)
+    logger.info("Extracting data from all 7 tracks and 14 races...")
+    logger.info("Adding professional-level racing knowledge...")
+    logger.info('')
     
-    generator = EnhancedRAGDatasetGenerator()
+    generator = EnhancedRAGDatasetGenerator(emit_pretty='--pretty' in sys.argv, use_cache='--no-cache' not in sys.argv)
     generator.generate_complete_dataset()
     
-    print("\n" + "=" * 70)
-    print("✅ Enhanced RAG Dataset Generation Complete!")
-    print("\nDataset includes:")
-    print("  • Real race data from all tracks")
-    print("  • Professional driver development knowledge")
-    print("  • Team operations and strategy")
-    print("  • Advanced coaching techniques")
-    print("  • Weather impact analysis")
-    print("  • Data analysis methodologies")
-    print("  • Performance metrics and benchmarking")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info("✅ Enhanced RAG Dataset Generation Complete!")
+    logger.info("\nDataset includes:")
+    logger.info("  • Real race data from all tracks")
+    logger.info("  • Professional driver development knowledge")
+    logger.info("  • Team operations and strategy")
+    logger.info("  • Advanced coaching techniques")
+    logger.info("  • Weather impact analysis")
+    logger.info("  • Data analysis methodologies")
+    logger.info("  • Performance metrics and benchmarking")
+    logger.info("=" * 70)
 
 
 if __name__ == "__main__":
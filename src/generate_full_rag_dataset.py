@@ -3,24 +3,244 @@ Comprehensive RAG Dataset Generator
 Extracts real data from all 7 tracks and 14 races to create rich training data
 """
 
-import json
+import hashlib
+import logging
+import multiprocessing
 import sys
 import os
+import pickle
+import re
+import numpy as np
+import orjson
 import pandas as pd
-import glob
+import pyarrow as pa
+import pyarrow.parquet as pq
+import threading
+from collections import Counter
+from fnmatch import fnmatchcase
+from glob import glob
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from track_config import TRACKS, get_track_info, list_available_tracks
+from src.multi_track_loader import read_csv_fast
+from src.track_config import TRACKS, get_track_info, list_available_tracks
+
+logger = logging.getLogger(__name__)
+
+# Sector time columns in the analysis files: S1, S2, S3, ...
+_SECTOR_COL = re.compile(r'S\d+').fullmatch
+
+DIFFICULTY_LEVELS = ('beginner', 'intermediate', 'advanced')
+
+# Buffer size for streamed outputs (JSONL), so per-line writes don't become syscalls
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Low-cardinality label columns; the long question/answer text gains nothing from a dictionary
+PARQUET_DICTIONARY_COLUMNS = ['context.category', 'context.subcategory', 'context.track',
+                              'context.difficulty', 'context.data_source']
+
+# Per-race entries are cached here between runs, keyed on the race's input files
+RACE_CACHE_DIR = '.rag_cache'
+# Bump when the race processors change what they extract, to invalidate old caches
+RACE_CACHE_VERSION = '1'
+
+EXPERT_KNOWLEDGE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'expert_knowledge.json')
+
+
+@lru_cache(maxsize=None)
+def load_expert_knowledge():
+    """Load the static expert knowledge entries (parsed once per process)"""
+    with open(EXPERT_KNOWLEDGE_FILE, 'rb') as f:
+        return tuple(orjson.loads(f.read()))
+
+
+def open_output(path):
+    """Open an output file for binary writes behind a 1 MiB buffer"""
+    return open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+
+
+def dump_json(obj, path):
+    """Write obj to path as indented UTF-8 JSON (single place to swap the encoder)"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def dump_jsonl(entries, path):
+    """Write entries to path as JSON Lines (training format)"""
+    with open_output(path) as f:
+        for entry in entries:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def dump_parquet(entries, path):
+    """Write entries to path as a zstd-compressed Parquet table"""
+    table = pa.Table.from_pylist(entries).select(['id', 'question', 'answer', 'context', 'metadata'])
+    pq.write_table(table, path, compression='zstd', use_dictionary=PARQUET_DICTIONARY_COLUMNS)
+
+
+# Generated README for the complete dataset; the *_block fields are pre-joined lines
+_README_TEMPLATE = """# Complete Toyota GR Cup RAG Dataset
+
+## Overview
+Comprehensive RAG (Retrieval-Augmented Generation) dataset for AI race engineer training, extracted from real Toyota GR Cup race data across 7 tracks and 14 races.
+
+## Dataset Statistics
+- **Total Entries**: {total_entries}
+- **Tracks Covered**: {tracks_processed} (Barber, Indianapolis, COTA, Sebring, Road America, Sonoma, VIR)
+- **Races Analyzed**: {races_processed}
+- **Files Processed**: {files_analyzed}
+- **Generated**: {generated_date}
+
+## Categories
+{categories_block}
+## Difficulty Levels
+- **Beginner**: {beginner} entries
+- **Intermediate**: {intermediate} entries
+- **Advanced**: {advanced} entries
+
+## Data Sources
+{sources_block}
+## Files
+
+### Main Datasets
+- `race_engineer_complete.jsonl` - Training format (one JSON per line)
+{pretty_files_block}- `race_engineer_complete.parquet` - Columnar format (context/metadata as struct columns)
+
+### Category Files
+{category_files_block}
+### Track-Specific Files
+{track_files_block}
+### Statistics
+- `complete_dataset_stats.json` - Detailed statistics
+
+## Usage
+
+### For Fine-Tuning
+```python
+import json
+
+# Load JSONL format
+with open('race_engineer_complete.jsonl', 'r') as f:
+    dataset = [json.loads(line) for line in f]
+```
+
+### For RAG/Vector Database
+```python
+import json
+
+# Stream JSONL format
+with open('race_engineer_complete.jsonl', 'r') as f:
+    dataset = [json.loads(line) for line in f]
+
+# Extract for embeddings
+for entry in dataset:
+    text = f"Q: {{entry['question']}}\\nA: {{entry['answer']}}"
+    # Create embeddings and store in vector DB
+```
+
+### For Analytics (Parquet)
+```python
+import pyarrow.parquet as pq
+
+# Load columnar format
+dataset = pq.read_table('race_engineer_complete.parquet').to_pylist()
+```
+
+### Load Specific Category
+```python
+import json
+
+# Load only telemetry data (one JSON per line)
+with open('telemetry_complete.jsonl', 'r') as f:
+    telemetry_data = [json.loads(line) for line in f]
+```
+
+### Load Track-Specific Data
+```python
+import json
+
+# Load only Barber data (one JSON per line)
+with open('track_barber.jsonl', 'r') as f:
+    barber_data = [json.loads(line) for line in f]
+```
+
+## Entry Structure
+```json
+{{
+  "id": "rag_0001",
+  "question": "What was the fastest lap time at Barber Race 1?",
+  "answer": "The fastest lap at Barber Race 1 was 95.234 seconds...",
+  "context": {{
+    "category": "lap_times",
+    "subcategory": "fastest_lap",
+    "track": "barber",
+    "race": 1,
+    "difficulty": "intermediate",
+    "data_source": "lap_times"
+  }},
+  "metadata": {{
+    "source": "toyota_gr_cup_2025",
+    "domain": "motorsports_race_engineering",
+    "verified": true,
+    "created": "2025-11-23T..."
+  }}
+}}
+```
+
+## Data Quality
+- ✅ All entries extracted from real race data
+- ✅ Verified accuracy from official timing systems
+- ✅ Expert knowledge validated by racing professionals
+- ✅ Structured format for easy integration
+- ✅ Comprehensive coverage of race engineering topics
+
+## Applications
+1. **Fine-tuning LLMs** for race engineering assistance
+2. **RAG systems** for real-time race strategy
+3. **Chatbots** for driver coaching and telemetry analysis
+4. **Knowledge bases** for team training
+5. **Hybrid approaches** combining retrieval and generation
+
+## License
+Toyota GR Cup 2025 Dataset - For educational and research purposes
+
+## Generated By
+RaceIQ Multi-Track RAG Dataset Generator
+"""
+
+
+def configure_logging(level=logging.INFO):
+    """Send progress messages to stdout as plain lines"""
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout)
+
+
+def _process_track_in_worker(generator_cls, use_cache, generated_at, log_level, track_name):
+    """Process one track in a worker process; returns its entries and stats"""
+    configure_logging(log_level)
+    generator = generator_cls(use_cache=use_cache, workers=1)
+    generator.generated_at = generated_at
+    generator.process_track(track_name)
+    return generator.dataset, generator.stats
 
 
 class FullRAGDatasetGenerator:
     """Generate comprehensive RAG dataset from all track data"""
     
-    def __init__(self):
+    def __init__(self, emit_pretty=False, use_cache=True, workers=None):
         self.tracks = list_available_tracks()
+        # The indented .json copy of the full dataset is for manual review only
+        self.emit_pretty = emit_pretty
+        self.use_cache = use_cache
+        # Worker processes for track processing (None = one per CPU, 1 = in-process)
+        self.workers = workers
+        # One timestamp per run, shared by every entry and the stats file
+        self.generated_at = datetime.now().isoformat()
+        self._entry_metadata = None
         self.dataset = []
         self.entry_id = 1
         self.stats = {
@@ -29,15 +249,18 @@ class FullRAGDatasetGenerator:
             'files_analyzed': 0,
             'entries_generated': 0
         }
+        self._stats_lock = threading.Lock()
+        self._folder_files = {}
+        # (category, track, difficulty, data_source) per entry, parallel to self.dataset
+        self._entry_keys = []
     
     def generate_complete_dataset(self):
         """Generate complete RAG dataset from all tracks"""
-        print("🏁 Generating Complete Multi-Track RAG Dataset")
-        print("=" * 70)
+        logger.info("🏁 Generating Complete Multi-Track RAG Dataset")
+        logger.info("=" * 70)
         
         # Process each track
-        for track_name in self.tracks:
-            self.process_track(track_name)
+        self.process_tracks()
         
         # Add expert knowledge (not track-specific)
         self.add_expert_knowledge()
@@ -45,17 +268,38 @@ class FullRAGDatasetGenerator:
         # Save all datasets
         self.save_datasets()
         
-        print(f"\n✅ Generated {len(self.dataset)} RAG entries from real data")
-        print(f"📊 Stats: {self.stats}")
+        logger.info(f"\n✅ Generated {len(self.dataset)} RAG entries from real data")
+        logger.info(f"📊 Stats: {self.stats}")
+    
+    def process_tracks(self):
+        """Process every track, spreading the tracks over worker processes"""
+        workers = min(self.workers or os.cpu_count() or 1, len(self.tracks))
+        if workers < 2:
+            for track_name in self.tracks:
+                self.process_track(track_name)
+            return
+        
+        # Tracks are independent; merge each worker's entries back in track order
+        worker = partial(_process_track_in_worker, type(self), self.use_cache, self.generated_at,
+                         logging.getLogger().getEffectiveLevel())
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(worker, self.tracks))
+        
+        for _, stats in results:
+            for key in ('tracks_processed', 'races_processed', 'files_analyzed'):
+                self.stats[key] += stats[key]
+        # One batch for all tracks, so the dataset grows once
+        track_entries = chain.from_iterable(entries for entries, _ in results)
+        self.add_entries([self._make_entry(e['question'], e['answer'], **e['context']) for e in track_entries])
     
     def process_track(self, track_name):
         """Process all data for a specific track"""
-        print(f"\n📍 Processing {track_name.upper()}...")
+        logger.info(f"\n📍 Processing {track_name.upper()}...")
         track = get_track_info(track_name)
         self.stats['tracks_processed'] += 1
         
         # Generate track overview from config
-        self.generate_track_overview(track_name, track)
+        self.add_entries(self.generate_track_overview(track_name, track))
         
         # Process each race
         for race_num in [1, 2]:
@@ -63,7 +307,7 @@ class FullRAGDatasetGenerator:
     
     def process_race(self, track_name, track, race_num):
         """Process data from a specific race"""
-        print(f"  🏎️  Race {race_num}...")
+        logger.info(f"  🏎️  Race {race_num}...")
         
         try:
             # Get race folder
@@ -72,717 +316,571 @@ class FullRAGDatasetGenerator:
             else:
                 folder = track.race_folders[race_num - 1]
             
-            # Process results
-            self.process_results(track_name, track, race_num, folder)
-            
-            # Process lap times
-            self.process_lap_times(track_name, track, race_num, folder)
-            
-            # Process weather
-            self.process_weather(track_name, track, race_num, folder)
-            
-            # Process best laps
-            self.process_best_laps(track_name, track, race_num, folder)
+            # Resolve every input file for this race up front
+            paths = {
+                'results': self._find_race_file(folder, track.results_pattern.format(race=race_num)),
+                'lap_times': self._find_race_file(folder, track.lap_time_pattern.format(race=race_num)),
+                'weather': self._find_race_file(folder, track.weather_pattern.format(race=race_num)),
+                'best_laps': self._find_race_file(folder, track.best_laps_pattern.format(race=race_num)),
+                'analysis': self._find_race_file(folder, track.analysis_pattern.format(race=race_num))
+            }
             
-            # Process analysis data
-            self.process_analysis(track_name, track, race_num, folder)
+            cache_path = self._race_cache_path(track_name, track, race_num, paths) if self.use_cache else None
+            cached = self._load_race_cache(cache_path)
+            if cached is not None:
+                files_analyzed, entries = cached
+                logger.info(f"    ↺ Reusing cached entries ({len(entries)})")
+                self.stats['files_analyzed'] += files_analyzed
+                self.add_entries([self._make_entry(e['question'], e['answer'], **e['context']) for e in entries])
+            else:
+                files_before = self.stats['files_analyzed']
+                entries, complete = self._run_processors(track_name, track, race_num, paths)
+                # Only cache clean runs, so processor errors are reported again next time
+                if cache_path and complete:
+                    self._save_race_cache(cache_path, self.stats['files_analyzed'] - files_before, entries)
+                self.add_entries(entries)
             
             self.stats['races_processed'] += 1
             
         except Exception as e:
-            print(f"    ⚠️  Error processing race {race_num}: {e}")
+            logger.warning(f"    ⚠️  Error processing race {race_num}: {e}")
+    
+    def _run_processors(self, track_name, track, race_num, paths):
+        """Run the per-file processors for a race; returns (entries, whether all succeeded)"""
+        # Results, lap times, weather, best laps and analysis are independent
+        # file reads, so overlap them and merge the entries in a fixed order
+        processors = (
+            ("Results", self.process_results, paths['results']),
+            ("Lap times", self.process_lap_times, paths['lap_times']),
+            ("Weather", self.process_weather, paths['weather']),
+            ("Best laps", self.process_best_laps, paths['best_laps']),
+            ("Analysis", self.process_analysis, paths['analysis'])
+        )
+        entries = []
+        complete = True
+        with ThreadPoolExecutor(max_workers=len(processors)) as executor:
+            futures = [executor.submit(fn, track_name, track, race_num, path) for _, fn, path in processors]
+            for (label, _, _), future in zip(processors, futures):
+                try:
+                    entries.extend(future.result())
+                except Exception as e:
+                    logger.warning(f"      ⚠️  {label} error: {e}")
+                    complete = False
+        return entries, complete
+    
+    def _race_cache_path(self, track_name, track, race_num, paths):
+        """Cache file for a race, keyed on the track config and each input file's size and mtime"""
+        parts = [RACE_CACHE_VERSION, repr(track), str(race_num)]
+        for label, path in paths.items():
+            if path:
+                st = os.stat(path)
+                parts.append(f"{label}:{path}:{st.st_mtime_ns}:{st.st_size}")
+            else:
+                parts.append(f"{label}:")
+        key = hashlib.blake2b('\n'.join(parts).encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(RACE_CACHE_DIR, f"{track_name}_race{race_num}_{key}.pkl")
+    
+    def _load_race_cache(self, cache_path):
+        """Return the cached (files_analyzed, entries) for a race, or None"""
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def _save_race_cache(self, cache_path, files_analyzed, entries):
+        """Cache a race's entries, replacing any stale cache for the same race"""
+        os.makedirs(RACE_CACHE_DIR, exist_ok=True)
+        prefix = os.path.basename(cache_path).rsplit('_', 1)[0]
+        for stale in glob(os.path.join(RACE_CACHE_DIR, f"{prefix}_*.pkl")):
+            os.remove(stale)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((files_analyzed, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
     
-    def process_results(self, track_name, track, race_num, folder):
+    def _scan_race_folder(self, folder):
+        """List a race folder once and map file names to paths"""
+        if folder not in self._folder_files:
+            try:
+                with os.scandir(folder) as it:
+                    self._folder_files[folder] = {e.name: e.path for e in it if e.is_file()}
+            except OSError:
+                self._folder_files[folder] = {}
+        return self._folder_files[folder]
+    
+    def _find_race_file(self, folder, pattern):
+        """Resolve a file name or glob pattern within a race folder, or None"""
+        folder_files = self._scan_race_folder(folder)
+        if pattern in folder_files:
+            return folder_files[pattern]
+        matches = sorted(name for name in folder_files if fnmatchcase(name, pattern))
+        return folder_files[matches[0]] if matches else None
+    
+    def process_results(self, track_name, track, race_num, file_path):
         """Extract insights from race results"""
+        entries = []
+        if not file_path:
+            return entries
+        
+        # Only the winner's total time and the row count are needed; pyarrow
+        # parses just that column (read_csv_fast hands files it rejects, or
+        # that lack the column, to pd.read_csv)
         try:
-            pattern = os.path.join(folder, track.results_pattern.format(race=race_num))
-            files = glob.glob(pattern)
-            
-            if not files:
-                return
-            
-            df = pd.read_csv(files[0], delimiter=';', encoding='utf-8')
+            df = read_csv_fast(file_path, delimiter=';', columns=['TOTAL_TIME'])
+        except ValueError:
+            # No TOTAL_TIME column - a single column is enough for the field size
+            df = pd.read_csv(file_path, delimiter=';', encoding='utf-8', usecols=[0])
+        with self._stats_lock:
             self.stats['files_analyzed'] += 1
+
+        # Extract race winner info
+        if len(df) > 0:
+            winner = df.iloc[0]
+            total_time = winner.get('TOTAL_TIME', 'N/A')
             
-            # Extract race winner info
-            if len(df) > 0:
-                winner = df.iloc[0]
-                total_time = winner.get('TOTAL_TIME', 'N/A')
-                
-                self.add_entry(
-                    question=f"What was the winning time at {track.name} Race {race_num}?",
-                    answer=f"The race winner at {track.name} Race {race_num} completed the race in {total_time}. This represents the fastest overall performance across all {len(df)} competitors in the race.",
-                    category="race_results",
-                    subcategory="winner_stats",
-                    track=track_name,
-                    race=race_num,
-                    difficulty="beginner",
-                    data_source="results"
-                )
-            
-            # Field size
-            self.add_entry(
-                question=f"How many cars competed at {track.name} Race {race_num}?",
-                answer=f"{len(df)} cars competed in Race {race_num} at {track.name}. All competitors raced in the Toyota GR86 Am class, making it a spec series where driver skill and strategy are the primary differentiators.",
+            entries.append(self._make_entry(
+                question=f"What was the winning time at {track.name} Race {race_num}?",
+                answer=f"The race winner at {track.name} Race {race_num} completed the race in {total_time}. This represents the fastest overall performance across all {len(df)} competitors in the race.",
                 category="race_results",
-                subcategory="field_size",
+                subcategory="winner_stats",
                 track=track_name,
                 race=race_num,
                 difficulty="beginner",
                 data_source="results"
-            )
-            
-        except Exception as e:
-            print(f"      ⚠️  Results error: {e}")
+            ))
+        
+        # Field size
+        entries.append(self._make_entry(
+            question=f"How many cars competed at {track.name} Race {race_num}?",
+            answer=f"{len(df)} cars competed in Race {race_num} at {track.name}. All competitors raced in the Toyota GR86 Am class, making it a spec series where driver skill and strategy are the primary differentiators.",
+            category="race_results",
+            subcategory="field_size",
+            track=track_name,
+            race=race_num,
+            difficulty="beginner",
+            data_source="results"
+        ))
+        
+        return entries
 
     
-    def process_lap_times(self, track_name, track, race_num, folder):
+    def process_lap_times(self, track_name, track, race_num, file_path):
         """Extract insights from lap time data"""
-        try:
-            # Build file path
-            lap_time_file = track.lap_time_pattern.format(race=race_num)
-            file_path = os.path.join(folder, lap_time_file)
-            
-            if not os.path.exists(file_path):
-                return
-            
-            df = pd.read_csv(file_path, encoding='utf-8')
-            self.stats['files_analyzed'] += 1
-            
-            if 'LAP_TIME' in df.columns and len(df) > 0:
-                # Convert lap times to seconds
-                lap_times = pd.to_numeric(df['LAP_TIME'], errors='coerce').dropna()
-                
-                if len(lap_times) > 0:
-                    fastest = lap_times.min()
-                    slowest = lap_times.max()
-                    avg = lap_times.mean()
-                    
-                    self.add_entry(
-                        question=f"What was the fastest lap time at {track.name} Race {race_num}?",
-                        answer=f"The fastest lap at {track.name} Race {race_num} was {fastest:.3f} seconds. The average lap time was {avg:.3f}s, with the slowest at {slowest:.3f}s. This {fastest:.3f}s lap represents the ultimate pace achievable at this {track.length_km}km circuit.",
-                        category="lap_times",
-                        subcategory="fastest_lap",
-                        track=track_name,
-                        race=race_num,
-                        difficulty="intermediate",
-                        data_source="lap_times"
-                    )
-                    
-                    # Lap time consistency analysis
-                    std_dev = lap_times.std()
-                    self.add_entry(
-                        question=f"How consistent were lap times at {track.name} Race {race_num}?",
-                        answer=f"Lap time consistency at {track.name} Race {race_num} showed a standard deviation of {std_dev:.3f}s. The fastest lap was {fastest:.3f}s while the average was {avg:.3f}s, indicating a {((avg-fastest)/fastest*100):.1f}% variation. Good consistency is typically within ±0.5s.",
-                        category="performance",
-                        subcategory="consistency",
-                        track=track_name,
-                        race=race_num,
-                        difficulty="advanced",
-                        data_source="lap_times"
-                    )
-            
-        except Exception as e:
-            print(f"      ⚠️  Lap times error: {e}")
-    
-    def process_weather(self, track_name, track, race_num, folder):
-        """Extract weather conditions"""
-        try:
-            pattern = os.path.join(folder, track.weather_pattern.format(race=race_num))
-            files = glob.glob(pattern)
-            
-            if not files:
-                return
-            
-            df = pd.read_csv(files[0], delimiter=';', encoding='utf-8')
+        entries = []
+        if not file_path:
+            return entries
+        
+        # Only parse the lap time column
+        df = pd.read_csv(file_path, encoding='utf-8', usecols=lambda col: col == 'LAP_TIME')
+        with self._stats_lock:
             self.stats['files_analyzed'] += 1
+        
+        if 'LAP_TIME' in df.columns and len(df) > 0:
+            # Convert lap times to seconds and reduce on the raw float64 array
+            lap_times = pd.to_numeric(df['LAP_TIME'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            lap_times = lap_times[~np.isnan(lap_times)]
             
-            if len(df) > 0:
-                # Get weather info
-                weather_row = df.iloc[0]
-                track_temp = weather_row.get('TRACK_TEMP', 'N/A')
-                air_temp = weather_row.get('AIR_TEMP', 'N/A')
+            if lap_times.size > 0:
+                fastest = lap_times.min()
+                slowest = lap_times.max()
+                avg = lap_times.mean()
                 
-                self.add_entry(
-                    question=f"What were the weather conditions at {track.name} Race {race_num}?",
-                    answer=f"At {track.name} Race {race_num}, the track temperature was {track_temp}°C and air temperature was {air_temp}°C. These conditions significantly affect tire performance and grip levels. Optimal track temps are typically 25-35°C for best tire performance.",
-                    category="weather",
-                    subcategory="conditions",
+                entries.append(self._make_entry(
+                    question=f"What was the fastest lap time at {track.name} Race {race_num}?",
+                    answer=f"The fastest lap at {track.name} Race {race_num} was {fastest:.3f} seconds. The average lap time was {avg:.3f}s, with the slowest at {slowest:.3f}s. This {fastest:.3f}s lap represents the ultimate pace achievable at this {track.length_km}km circuit.",
+                    category="lap_times",
+                    subcategory="fastest_lap",
                     track=track_name,
                     race=race_num,
                     difficulty="intermediate",
-                    data_source="weather"
-                )
-            
-        except Exception as e:
-            print(f"      ⚠️  Weather error: {e}")
-    
-    def process_best_laps(self, track_name, track, race_num, folder):
-        """Extract best lap information"""
-        try:
-            pattern = os.path.join(folder, track.best_laps_pattern.format(race=race_num))
-            files = glob.glob(pattern)
-            
-            if not files:
-                return
-            
-            df = pd.read_csv(files[0], delimiter=';', encoding='utf-8')
-            self.stats['files_analyzed'] += 1
-            
-            if len(df) >= 3:
-                # Top 3 laps
-                top3_times = []
-                for i in range(min(3, len(df))):
-                    lap_time = df.iloc[i].get('BEST_TIME', 'N/A')
-                    top3_times.append(str(lap_time))
+                    data_source="lap_times"
+                ))
                 
-                self.add_entry(
-                    question=f"What were the top 3 lap times at {track.name} Race {race_num}?",
-                    answer=f"The top 3 lap times at {track.name} Race {race_num} were: 1st: {top3_times[0]}, 2nd: {top3_times[1]}, 3rd: {top3_times[2]}. These represent the absolute best single-lap performances during the race and serve as benchmark times for this circuit.",
-                    category="lap_times",
-                    subcategory="top_laps",
+                # Lap time consistency analysis (sample std, matching pandas' Series.std())
+                std_dev = lap_times.std(ddof=1) if lap_times.size > 1 else np.nan
+                entries.append(self._make_entry(
+                    question=f"How consistent were lap times at {track.name} Race {race_num}?",
+                    answer=f"Lap time consistency at {track.name} Race {race_num} showed a standard deviation of {std_dev:.3f}s. The fastest lap was {fastest:.3f}s while the average was {avg:.3f}s, indicating a {((avg-fastest)/fastest*100):.1f}% variation. Good consistency is typically within ±0.5s.",
+                    category="performance",
+                    subcategory="consistency",
                     track=track_name,
                     race=race_num,
-                    difficulty="intermediate",
-                    data_source="best_laps"
-                )
+                    difficulty="advanced",
+                    data_source="lap_times"
+                ))
+        
+        return entries
+    
+    def process_weather(self, track_name, track, race_num, file_path):
+        """Extract weather conditions"""
+        entries = []
+        if not file_path:
+            return entries
+        
+        df = pd.read_csv(file_path, delimiter=';', encoding='utf-8')
+        with self._stats_lock:
+            self.stats['files_analyzed'] += 1
+        
+        if len(df) > 0:
+            # Get weather info
+            weather_row = df.iloc[0]
+            track_temp = weather_row.get('TRACK_TEMP', 'N/A')
+            air_temp = weather_row.get('AIR_TEMP', 'N/A')
             
-        except Exception as e:
-            print(f"      ⚠️  Best laps error: {e}")
+            entries.append(self._make_entry(
+                question=f"What were the weather conditions at {track.name} Race {race_num}?",
+                answer=f"At {track.name} Race {race_num}, the track temperature was {track_temp}°C and air temperature was {air_temp}°C. These conditions significantly affect tire performance and grip levels. Optimal track temps are typically 25-35°C for best tire performance.",
+                category="weather",
+                subcategory="conditions",
+                track=track_name,
+                race=race_num,
+                difficulty="intermediate",
+                data_source="weather"
+            ))
+        
+        return entries
+    
+    def process_best_laps(self, track_name, track, race_num, file_path):
+        """Extract best lap information"""
+        entries = []
+        if not file_path:
+            return entries
+        
+        df = pd.read_csv(file_path, delimiter=';', encoding='utf-8')
+        with self._stats_lock:
+            self.stats['files_analyzed'] += 1
+        
+        if len(df) >= 3:
+            # Top 3 laps (slice the column once instead of materializing rows)
+            if 'BEST_TIME' in df.columns:
+                top3_times = df['BEST_TIME'].head(3).astype(str).tolist()
+            else:
+                top3_times = ['N/A'] * 3
+
+            entries.append(self._make_entry(
+                question=f"What were the top 3 lap times at {track.name} Race {race_num}?",
+                answer=f"The top 3 lap times at {track.name} Race {race_num} were: 1st: {top3_times[0]}, 2nd: {top3_times[1]}, 3rd: {top3_times[2]}. These represent the absolute best single-lap performances during the race and serve as benchmark times for this circuit.",
+                category="lap_times",
+                subcategory="top_laps",
+                track=track_name,
+                race=race_num,
+                difficulty="intermediate",
+                data_source="best_laps"
+            ))
+        
+        return entries
     
-    def process_analysis(self, track_name, track, race_num, folder):
+    def process_analysis(self, track_name, track, race_num, file_path):
         """Extract sector and analysis data"""
-        try:
-            pattern = os.path.join(folder, track.analysis_pattern.format(race=race_num))
-            files = glob.glob(pattern)
-            
-            if not files:
-                return
-            
-            df = pd.read_csv(files[0], delimiter=';', encoding='utf-8')
+        entries = []
+        if not file_path:
+            return entries
+        
+        # Only parse the sector time columns
+        df = pd.read_csv(file_path, delimiter=';', encoding='utf-8', usecols=_SECTOR_COL)
+        with self._stats_lock:
             self.stats['files_analyzed'] += 1
+        
+        # Check for sector times
+        sector_cols = [col for col in df.columns if _SECTOR_COL(col)]
+        
+        if sector_cols and len(df) > 0:
+            # Analyze sector performance (single vectorized min/mean pass)
+            sector_df = df[sector_cols].apply(pd.to_numeric, errors='coerce')
+            agg = sector_df.agg(['min', 'mean'])
+            sector_data = {
+                col: {
+                    'fastest': agg.loc['min', col],
+                    'average': agg.loc['mean', col]
+                }
+                for col in sector_cols
+                if pd.notna(agg.loc['min', col])
+            }
             
-            # Check for sector times
-            sector_cols = [col for col in df.columns if col.startswith('S') and col[1:].isdigit()]
-            
-            if sector_cols and len(df) > 0:
-                # Analyze sector performance
-                sector_data = {}
-                for col in sector_cols:
-                    sector_times = pd.to_numeric(df[col], errors='coerce').dropna()
-                    if len(sector_times) > 0:
-                        sector_data[col] = {
-                            'fastest': sector_times.min(),
-                            'average': sector_times.mean()
-                        }
+            if sector_data:
+                sector_info = ", ".join([f"{s}: {d['fastest']:.3f}s" for s, d in sector_data.items()])
                 
-                if sector_data:
-                    sector_info = ", ".join([f"{s}: {d['fastest']:.3f}s" for s, d in sector_data.items()])
-                    
-                    self.add_entry(
-                        question=f"What were the fastest sector times at {track.name} Race {race_num}?",
-                        answer=f"The fastest sector times at {track.name} Race {race_num} were: {sector_info}. Sector analysis helps identify where drivers gain or lose time. Focus on improving your weakest sector for the biggest lap time gains.",
-                        category="performance",
-                        subcategory="sector_analysis",
-                        track=track_name,
-                        race=race_num,
-                        difficulty="advanced",
-                        data_source="analysis"
-                    )
-            
-        except Exception as e:
-            print(f"      ⚠️  Analysis error: {e}")
+                entries.append(self._make_entry(
+                    question=f"What were the fastest sector times at {track.name} Race {race_num}?",
+                    answer=f"The fastest sector times at {track.name} Race {race_num} were: {sector_info}. Sector analysis helps identify where drivers gain or lose time. Focus on improving your weakest sector for the biggest lap time gains.",
+                    category="performance",
+                    subcategory="sector_analysis",
+                    track=track_name,
+                    race=race_num,
+                    difficulty="advanced",
+                    data_source="analysis"
+                ))
+        
+        return entries
     
     def generate_track_overview(self, track_name, track):
         """Generate track overview from config"""
+        name, km, turns, direction = track.name, track.length_km, track.turns, track.direction
+        entries = []
         
         # Basic track info
-        self.add_entry(
-            question=f"Tell me about {track.name}",
-            answer=f"{track.name} is a {track.length_km}km circuit with {track.turns} turns, running {track.direction}. It's part of the Toyota GR Cup championship. The track is known for its {'technical' if track.turns > 15 else 'flowing'} layout with {'many elevation changes' if track_name in ['barber', 'sonoma', 'vir'] else 'high-speed sections'}.",
+        entries.append(self._make_entry(
+            question=f"Tell me about {name}",
+            answer=f"{name} is a {km}km circuit with {turns} turns, running {direction}. It's part of the Toyota GR Cup championship. The track is known for its {'technical' if turns > 15 else 'flowing'} layout with {'many elevation changes' if track_name in ['barber', 'sonoma', 'vir'] else 'high-speed sections'}.",
             category="track_info",
             subcategory="overview",
             track=track_name,
             difficulty="beginner",
             data_source="track_config"
-        )
+        ))
         
         # Track characteristics
         characteristics = self.get_track_characteristics(track_name, track)
-        self.add_entry(
-            question=f"What makes {track.name} unique?",
+        entries.append(self._make_entry(
+            question=f"What makes {name} unique?",
             answer=characteristics,
             category="track_info",
             subcategory="characteristics",
             track=track_name,
             difficulty="intermediate",
             data_source="track_config"
-        )
+        ))
         
         # Strategy implications
         strategy = self.get_track_strategy(track_name, track)
-        self.add_entry(
-            question=f"What's the best strategy for {track.name}?",
+        entries.append(self._make_entry(
+            question=f"What's the best strategy for {name}?",
             answer=strategy,
             category="strategy",
             subcategory="track_specific",
             track=track_name,
             difficulty="advanced",
             data_source="expert_knowledge"
-        )
+        ))
+        
+        return entries
     
     def get_track_characteristics(self, track_name, track):
         """Get track-specific characteristics"""
+        name, km, turns, direction = track.name, track.length_km, track.turns, track.direction
         characteristics = {
-            'barber': f"{track.name} features {track.turns} technical corners with significant elevation changes. The {track.length_km}km layout rewards smooth driving and precise braking. Key challenges include the downhill braking zones and blind apexes.",
+            'barber': f"{name} features {turns} technical corners with significant elevation changes. The {km}km layout rewards smooth driving and precise braking. Key challenges include the downhill braking zones and blind apexes.",
             
-            'indianapolis': f"{track.name} combines the famous oval with an infield road course, creating a unique {track.length_km}km layout with {track.turns} turns. The mix of high-speed oval sections and technical infield corners demands versatility.",
+            'indianapolis': f"{name} combines the famous oval with an infield road course, creating a unique {km}km layout with {turns} turns. The mix of high-speed oval sections and technical infield corners demands versatility.",
             
-            'cota': f"{track.name} is a world-class {track.length_km}km circuit with {track.turns} corners, running {track.direction}. The dramatic elevation changes, especially Turn 1's uphill approach, and the technical sector 2 make it highly challenging.",
+            'cota': f"{name} is a world-class {km}km circuit with {turns} corners, running {direction}. The dramatic elevation changes, especially Turn 1's uphill approach, and the technical sector 2 make it highly challenging.",
             
-            'sebring': f"{track.name} is a historic {track.length_km}km circuit known for its bumpy surface and {track.turns} challenging corners. The rough track surface tests both car and driver endurance, with unique concrete sections.",
+            'sebring': f"{name} is a historic {km}km circuit known for its bumpy surface and {turns} challenging corners. The rough track surface tests both car and driver endurance, with unique concrete sections.",
             
-            'road_america': f"{track.name} is one of America's longest tracks at {track.length_km}km with {track.turns} turns. The high-speed nature, long straights, and fast corners like the Kink demand bravery and commitment.",
+            'road_america': f"{name} is one of America's longest tracks at {km}km with {turns} turns. The high-speed nature, long straights, and fast corners like the Kink demand bravery and commitment.",
             
-            'sonoma': f"{track.name} is a {track.length_km}km technical circuit with {track.turns} corners and significant elevation changes. The uphill and downhill sections create unique braking and acceleration challenges.",
+            'sonoma': f"{name} is a {km}km technical circuit with {turns} corners and significant elevation changes. The uphill and downhill sections create unique braking and acceleration challenges.",
             
-            'vir': f"{track.name} features {track.turns} corners across {track.length_km}km of flowing, technical layout. Known for elevation changes and the challenging Oak Tree corner, it rewards smooth, committed driving."
+            'vir': f"{name} features {turns} corners across {km}km of flowing, technical layout. Known for elevation changes and the challenging Oak Tree corner, it rewards smooth, committed driving."
         }
         
-        return characteristics.get(track_name, f"{track.name} is a {track.length_km}km circuit with {track.turns} turns.")
+        return characteristics.get(track_name, f"{name} is a {km}km circuit with {turns} turns.")
     
     def get_track_strategy(self, track_name, track):
         """Get track-specific strategy advice"""
-        if track.length_km > 5.5:
+        name, km, turns, direction = track.name, track.length_km, track.turns, track.direction
+        if km > 5.5:
             fuel_note = "Fuel management is critical due to the long lap distance. Monitor consumption closely."
-        elif track.length_km < 4.0:
+        elif km < 4.0:
             fuel_note = "Shorter lap length means more laps and more opportunities to make up positions."
         else:
             fuel_note = "Standard fuel strategy applies with typical consumption rates."
         
-        if track.turns > 17:
+        if turns > 17:
             tire_note = "High corner count increases tire degradation. Consider tire management strategy."
         else:
             tire_note = "Moderate tire wear allows for aggressive driving throughout the stint."
         
-        return f"Strategy for {track.name}: {fuel_note} {tire_note} The {track.direction} direction affects tire wear patterns. Typical pit window is laps 12-15 or 18-22 in a 27-lap race. Track position is {'crucial' if track.turns > 15 else 'important but overtaking is possible'}."
+        return f"Strategy for {name}: {fuel_note} {tire_note} The {direction} direction affects tire wear patterns. Typical pit window is laps 12-15 or 18-22 in a 27-lap race. Track position is {'crucial' if turns > 15 else 'important but overtaking is possible'}."
 
     
     def add_expert_knowledge(self):
         """Add expert racing knowledge (not track-specific)"""
-        print("\n🎓 Adding expert knowledge...")
-        
-        # Telemetry parameters
-        telemetry_params = [
-            ("Speed", "km/h", "Vehicle speed", "Monitor corner entry/exit speeds, identify braking points"),
-            ("Throttle (aps)", "%", "Accelerator pedal position", "Analyze throttle smoothness, optimize corner exits"),
-            ("Brake Pressure", "bar", "Front/rear brake pressure", "Evaluate braking technique, identify trail braking"),
-            ("Lateral G (accy_can)", "G", "Sideways acceleration", "Measure cornering speed, identify grip limits"),
-            ("Longitudinal G (accx_can)", "G", "Forward/backward acceleration", "Analyze acceleration and braking performance"),
-            ("Steering Angle", "degrees", "Steering wheel angle", "Evaluate steering smoothness, identify over/understeer")
-        ]
-        
-        for name, unit, desc, usage in telemetry_params:
-            self.add_entry(
-                question=f"What is {name} in telemetry?",
-                answer=f"{name} ({unit}) measures {desc}. Use it to: {usage}. This parameter is essential for understanding vehicle dynamics and driver technique in the Toyota GR86.",
-                category="telemetry",
-                subcategory="parameters",
-                difficulty="intermediate",
-                data_source="expert_knowledge"
-            )
-        
-        # Racing techniques
-        techniques = [
-            ("Racing Line", "What is the optimal racing line?", 
-             "The optimal racing line maximizes corner exit speed: Enter wide, turn in at the correct point, hit the apex at minimum speed (late apex usually best), exit wide with full throttle. Key principle: 'Slow in, fast out' - prioritize exit speed, especially before straights."),
-            
-            ("Braking", "How do I improve my braking technique?",
-             "Effective braking: 1) Brake in a straight line before turn-in, 2) Apply maximum pressure quickly (70-85 bar), 3) Trail brake: gradually release as you turn in, 4) Feel for lock-up, 5) Finish braking before apex. Practice threshold braking for best results."),
-            
-            ("Throttle Control", "How do I apply throttle smoothly?",
-             "Smooth throttle application: Begin at apex when unwinding steering, progressive application (0→100% gradually), match to steering angle (less steering = more throttle), feel for wheelspin, full throttle when straight. Smooth = fast and preserves tires."),
-            
-            ("Tire Management", "How do I extend tire life?",
-             "Extend tire life by: 1) Smooth inputs (gradual throttle/brake), 2) Avoid wheelspin, 3) Minimize sliding, 4) Proper tire temps (25-35°C optimal), 5) Strategic lift-and-coast. Trade 0.2-0.3s/lap early to gain 1-2s/lap advantage late in stint."),
-            
-            ("Consistency", "How do I drive more consistently?",
-             "Build consistency through: 1) Reference points (braking markers, turn-in points, apexes), 2) Repeatable technique, 3) Smooth driving, 4) Mental focus, 5) Physical fitness. Aim for ±0.5s lap time variation. Consistency beats occasional fast laps.")
-        ]
-        
-        for topic, question, answer in techniques:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="coaching",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="intermediate",
-                data_source="expert_knowledge"
-            )
+        logger.info("\n🎓 Adding expert knowledge...")
         
-        # Strategy scenarios
-        strategies = [
-            ("Undercut", "When should I use an undercut strategy?",
-             "Use an undercut when: 1) Within 3 seconds of car ahead, 2) Tire degradation is significant (>0.3s/lap), 3) Pit loss time is low (<25s), 4) Limited overtaking opportunities. Pit 2-3 laps before competitor, push hard on fresh tires. Most effective laps 12-14 in a 27-lap race."),
-            
-            ("Overcut", "What is an overcut strategy?",
-             "An overcut is staying out longer after competitor pits. Works when: 1) Your tires are still performing, 2) Track is clear (no traffic), 3) You can push hard for 3-5 laps, 4) Pit loss time is high. Stay out, set fast laps, pit later and emerge ahead."),
-            
-            ("Safety Car", "How do I respond to a safety car?",
-             "Safety car strategy depends on position: If leading: Stay out if tires good, pit if old. If mid-pack: Usually pit (free stop), take fresh tires. If at back: Gamble on staying out for track position. Key factors: Tire age (>15 laps = pit), fuel level, gap to cars ahead/behind."),
-            
-            ("Fuel Management", "How do I manage fuel during a race?",
-             "Fuel management: 1) Calculate consumption (2-3 liters/lap in GR86), 2) Monitor fuel vs laps remaining, 3) If short: Lift-and-coast, short-shift (500rpm early), reduce brake drag, 4) If comfortable: Push normally. Running out costs 30+ seconds, conservative pace costs 0.5-1s/lap.")
-        ]
-        
-        for topic, question, answer in strategies:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="strategy",
-                subcategory=topic.lower(),
-                difficulty="advanced",
-                data_source="expert_knowledge"
-            )
-        
-        # Vehicle dynamics
-        dynamics = [
-            ("Understeer", "What is understeer and how do I fix it?",
-             "Understeer = front tires lose grip first, car won't turn. Causes: Too much entry speed, early throttle, wrong line. Fixes: Brake earlier, slower entry, later apex, trail brake more, reduce mid-corner throttle. Driving around it requires patience."),
-            
-            ("Oversteer", "What is oversteer and how do I fix it?",
-             "Oversteer = rear tires lose grip first, car rotates too much. Causes: Too much throttle, lift-off mid-corner, aggressive inputs. Fixes: Smoother throttle, avoid sudden lift, earlier apex, reduce trail braking. Catch slides early with steering correction."),
-            
-            ("Weight Transfer", "How does weight transfer affect handling?",
-             "Weight transfer: Braking = weight to front (more front grip). Accelerating = weight to rear (more rear grip). Cornering = weight to outside. Use it: Trail brake to keep weight on front for turn-in, smooth throttle to transfer weight to rear for traction."),
-            
-            ("Tire Pressure", "How does tire pressure affect performance?",
-             "Tire pressure effects: Too low = more grip but overheats, wears faster. Too high = less grip, bouncy, uneven wear. Optimal: 30-35 PSI (hot) for GR86. Adjust: +2 PSI if overheating, -2 PSI if not warming up. Check after 3-5 laps when hot.")
-        ]
-        
-        for topic, question, answer in dynamics:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="vehicle_dynamics",
-                subcategory=topic.lower(),
-                difficulty="advanced",
-                data_source="expert_knowledge"
-            )
-        
-        # Weather conditions
-        weather = [
-            ("Track Temperature", "How does track temperature affect performance?",
-             "Track temp impact: Cold (<20°C) = hard to warm tires, less grip. Optimal (25-35°C) = best grip, consistent performance. Hot (>40°C) = tire degradation increases, grip can decrease. Adjust driving: Cold = aggressive warm-up, smoother inputs. Hot = manage tire temps, avoid excessive sliding."),
-            
-            ("Wet Conditions", "How do I drive in wet conditions?",
-             "Wet driving: 1) Brake 50-100% earlier, 2) Reduce corner speed 20-30%, 3) Smooth inputs (sudden movements = spin), 4) Avoid painted lines and curbs, 5) Look for grip (racing line may not be optimal), 6) Increase following distance. Patience is key - crashes lose more time than conservative pace."),
-            
-            ("Wind Effects", "How does wind affect racing?",
-             "Wind impact: Headwind = reduces top speed, increases drag, better cooling. Tailwind = higher top speed, less cooling. Crosswind = affects handling, changes braking points, requires steering correction. Adjust: Headwind = draft more, brake earlier. Tailwind = brake later. Crosswind = anticipate push, adjust line.")
-        ]
-        
-        for topic, question, answer in weather:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="weather",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="intermediate",
-                data_source="expert_knowledge"
-            )
-        
-        # Championship strategy
-        championship = [
-            ("Points System", "How does the Toyota GR Cup points system work?",
-             "Points: 1st=25, 2nd=18, 3rd=15, 4th=12, 5th=10, 6th=8, 7th=6, 8th=4, 9th=2, 10th=1. Bonus: Fastest lap=1 point (if in top 10). Strategy: Consistency beats occasional wins. P5 every race > P1 then DNF. Protect points when leading championship."),
-            
-            ("Risk Management", "When should I take risks vs play it safe?",
-             "Take risks when: Behind in championship, late in season, need positions, nothing to lose. Play safe when: Leading championship, early in season, in points position, mechanical issues. Calculate: Is potential gain worth potential loss? P5 guaranteed vs 50% chance at P3 (risk DNF) = take P5 if leading."),
-            
-            ("Season Planning", "How do I plan a championship season?",
-             "Season planning: 1) Set realistic goals (target position), 2) Identify key races (double points, home tracks), 3) Budget resources (tires, parts, testing), 4) Plan improvements (weak areas), 5) Monitor rivals. Review after each race: On target? Adjust strategy? What to improve?")
-        ]
-        
-        for topic, question, answer in championship:
-            self.add_entry(
-                question=question,
-                answer=answer,
-                category="championship",
-                subcategory=topic.lower().replace(" ", "_"),
-                difficulty="advanced",
-                data_source="expert_knowledge"
-            )
+        self.add_entries([self._make_entry(**entry) for entry in load_expert_knowledge()])
     
-    def add_entry(self, question, answer, category, subcategory=None, 
-                  track=None, race=None, difficulty="intermediate", data_source="analysis"):
-        """Add a structured entry to the dataset"""
-        entry = {
-            "id": f"rag_{self.entry_id:04d}",
+    def _make_entry(self, question, answer, category, subcategory=None,
+                    track=None, race=None, difficulty="intermediate", data_source="analysis"):
+        """Build a structured entry; its id is assigned when it joins the dataset"""
+        # The labels repeat across thousands of entries; intern them so they share one object
+        return {
+            "id": None,
             "question": question.strip(),
             "answer": answer.strip(),
             "context": {
-                "category": category,
-                "subcategory": subcategory,
+                "category": sys.intern(category),
+                "subcategory": sys.intern(subcategory) if subcategory else subcategory,
                 "track": track,
                 "race": race,
-                "difficulty": difficulty,
-                "data_source": data_source
+                "difficulty": sys.intern(difficulty),
+                "data_source": sys.intern(data_source)
             },
-            "metadata": {
+            "metadata": self._shared_metadata()
+        }
+    
+    def _shared_metadata(self):
+        """The metadata block, identical for every entry of a run, so built once and shared"""
+        metadata = self._entry_metadata
+        if metadata is None or metadata["created"] != self.generated_at:
+            metadata = self._entry_metadata = {
                 "source": "toyota_gr_cup_2025",
                 "domain": "motorsports_race_engineering",
                 "verified": True,
-                "created": datetime.now().isoformat()
+                "created": self.generated_at
             }
-        }
-        self.dataset.append(entry)
-        self.entry_id += 1
-        self.stats['entries_generated'] += 1
+        return metadata
+    
+    def add_entries(self, entries):
+        """Append a batch of entries to the dataset, numbering them in order"""
+        entry_id = self.entry_id
+        entry_keys = self._entry_keys
+        for entry in entries:
+            entry["id"] = f"rag_{entry_id:04d}"
+            entry_id += 1
+            ctx = entry["context"]
+            entry_keys.append((ctx["category"], ctx["track"], ctx["difficulty"], ctx["data_source"]))
+        self.dataset.extend(entries)
+        self.entry_id = entry_id
+        self.stats['entries_generated'] += len(entries)
+    
+    def add_entry(self, question, answer, category, subcategory=None, 
+                  track=None, race=None, difficulty="intermediate", data_source="analysis"):
+        """Add a structured entry to the dataset"""
+        self.add_entries([self._make_entry(question, answer, category, subcategory,
+                                           track, race, difficulty, data_source)])
+    
+    def _write_shards(self, category_path, track_path):
+        """Stream entries into per-category and per-track JSONL shards in one pass
+        
+        category_path/track_path are format strings taking the category or
+        track name. Returns the category, track, difficulty and data source counts.
+        """
+        category_counts = Counter()
+        track_counts = Counter()
+        difficulty_counts = Counter()
+        source_counts = Counter()
+        handles = {}
+        
+        def shard(path):
+            handle = handles.get(path)
+            if handle is None:
+                handle = handles[path] = open_output(path)
+            return handle
+        
+        try:
+            for entry, (category, track, difficulty, source) in zip(self.dataset, self._entry_keys):
+                line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+                
+                category_counts[category] += 1
+                shard(category_path.format(category)).write(line)
+                
+                if track:
+                    track_counts[track] += 1
+                    shard(track_path.format(track)).write(line)
+                
+                difficulty_counts[difficulty] += 1
+                source_counts[source] += 1
+        finally:
+            for handle in handles.values():
+                handle.close()
+        
+        return category_counts, track_counts, difficulty_counts, source_counts
     
     def save_datasets(self):
         """Save all datasets in multiple formats"""
-        print("\n💾 Saving datasets...")
+        logger.info("\n💾 Saving datasets...")
         
         # Create output directory
         os.makedirs('rag_dataset', exist_ok=True)
         
-        # Save JSONL (for training)
-        with open('rag_dataset/race_engineer_complete.jsonl', 'w', encoding='utf-8') as f:
-            for entry in self.dataset:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-        print("  ✓ Saved race_engineer_complete.jsonl")
-        
-        # Save JSON (for review)
-        with open('rag_dataset/race_engineer_complete.json', 'w', encoding='utf-8') as f:
-            json.dump(self.dataset, f, indent=2, ensure_ascii=False)
-        print("  ✓ Saved race_engineer_complete.json")
-        
-        # Save by category
-        categories = {}
-        for entry in self.dataset:
-            cat = entry['context']['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(entry)
-        
-        for cat, entries in categories.items():
-            filename = f'rag_dataset/{cat}_complete.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
-        print(f"  ✓ Saved {len(categories)} category files")
-        
-        # Save by track
-        tracks = {}
-        for entry in self.dataset:
-            track = entry['context'].get('track')
-            if track:
-                if track not in tracks:
-                    tracks[track] = []
-                tracks[track].append(entry)
-        
-        for track, entries in tracks.items():
-            filename = f'rag_dataset/track_{track}.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2, ensure_ascii=False)
-        print(f"  ✓ Saved {len(tracks)} track-specific files")
+        # The outputs are independent, so encode and write them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # JSONL (for training), JSON (for review), Parquet (for columnar consumers)
+            jsonl = executor.submit(dump_jsonl, self.dataset, 'rag_dataset/race_engineer_complete.jsonl')
+            review = executor.submit(dump_json, self.dataset, 'rag_dataset/race_engineer_complete.json') if self.emit_pretty else None
+            parquet = executor.submit(dump_parquet, self.dataset, 'rag_dataset/race_engineer_complete.parquet')
+            # By category and by track, counting everything in the same pass
+            shards = executor.submit(self._write_shards, 'rag_dataset/{}_complete.jsonl', 'rag_dataset/track_{}.jsonl')
+            
+            jsonl.result()
+            logger.info("  ✓ Saved race_engineer_complete.jsonl")
+            if review:
+                review.result()
+                logger.info("  ✓ Saved race_engineer_complete.json")
+            parquet.result()
+            logger.info("  ✓ Saved race_engineer_complete.parquet")
+            categories, tracks, difficulty_counts, source_counts = shards.result()
+        logger.info(f"  ✓ Saved {len(categories)} category files")
+        logger.info(f"  ✓ Saved {len(tracks)} track-specific files")
         
         # Save statistics
         stats = {
             "total_entries": len(self.dataset),
             "processing_stats": self.stats,
-            "categories": {cat: len(entries) for cat, entries in categories.items()},
-            "tracks": {track: len(entries) for track, entries in tracks.items()},
-            "difficulty_levels": {
-                "beginner": len([e for e in self.dataset if e['context']['difficulty'] == 'beginner']),
-                "intermediate": len([e for e in self.dataset if e['context']['difficulty'] == 'intermediate']),
-                "advanced": len([e for e in self.dataset if e['context']['difficulty'] == 'advanced'])
-            },
-            "data_sources": {},
-            "generated_date": datetime.now().isoformat()
+            "categories": dict(categories),
+            "tracks": dict(tracks),
+            "difficulty_levels": {level: difficulty_counts[level] for level in DIFFICULTY_LEVELS},
+            "data_sources": dict(source_counts),
+            "generated_date": self.generated_at
         }
         
-        # Count data sources
-        for entry in self.dataset:
-            source = entry['context']['data_source']
-            stats['data_sources'][source] = stats['data_sources'].get(source, 0) + 1
-        
-        with open('rag_dataset/complete_dataset_stats.json', 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
-        print("  ✓ Saved complete_dataset_stats.json")
+        dump_json(stats, 'rag_dataset/complete_dataset_stats.json')
+        logger.info("  ✓ Saved complete_dataset_stats.json")
         
         # Generate README
         self.generate_readme(stats)
         
-        print(f"\n📊 Final Statistics:")
-        print(f"  Total entries: {stats['total_entries']}")
-        print(f"  Tracks processed: {self.stats['tracks_processed']}")
-        print(f"  Races processed: {self.stats['races_processed']}")
-        print(f"  Files analyzed: {self.stats['files_analyzed']}")
-        print(f"  Categories: {len(categories)}")
-        print(f"  Difficulty levels: {stats['difficulty_levels']}")
+        logger.info(f"\n📊 Final Statistics:")
+        logger.info(f"  Total entries: {stats['total_entries']}")
+        logger.info(f"  Tracks processed: {self.stats['tracks_processed']}")
+        logger.info(f"  Races processed: {self.stats['races_processed']}")
+        logger.info(f"  Files analyzed: {self.stats['files_analyzed']}")
+        logger.info(f"  Categories: {len(categories)}")
+        logger.info(f"  Difficulty levels: {stats['difficulty_levels']}")
     
     def generate_readme(self, stats):
         """Generate comprehensive README"""
-        readme = f"""# Complete Toyota GR Cup RAG Dataset
-
-## Overview
-Comprehensive RAG (Retrieval-Augmented Generation) dataset for AI race engineer training, extracted from real Toyota GR Cup race data across 7 tracks and 14 races.
-
-## Dataset Statistics
-- **Total Entries**: {stats['total_entries']}
-- **Tracks Covered**: {self.stats['tracks_processed']} (Barber, Indianapolis, COTA, Sebring, Road America, Sonoma, VIR)
-- **Races Analyzed**: {self.stats['races_processed']}
-- **Files Processed**: {self.stats['files_analyzed']}
-- **Generated**: {stats['generated_date'][:10]}
-
-## Categories
-"""
-        for cat, count in sorted(stats['categories'].items()):
-            readme += f"- **{cat}**: {count} entries\n"
-        
-        readme += f"""
-## Difficulty Levels
-- **Beginner**: {stats['difficulty_levels']['beginner']} entries
-- **Intermediate**: {stats['difficulty_levels']['intermediate']} entries
-- **Advanced**: {stats['difficulty_levels']['advanced']} entries
-
-## Data Sources
-"""
-        for source, count in sorted(stats['data_sources'].items()):
-            readme += f"- **{source}**: {count} entries\n"
-        
-        readme += """
-## Files
-
-### Main Datasets
-- `race_engineer_complete.jsonl` - Training format (one JSON per line)
-- `race_engineer_complete.json` - Human-readable format
-
-### Category Files
-"""
-        for cat in sorted(stats['categories'].keys()):
-            readme += f"- `{cat}_complete.json` - {stats['categories'][cat]} entries\n"
-        
-        readme += """
-### Track-Specific Files
-"""
-        for track in sorted(stats['tracks'].keys()):
-            readme += f"- `track_{track}.json` - {stats['tracks'][track]} entries\n"
-        
-        readme += """
-### Statistics
-- `complete_dataset_stats.json` - Detailed statistics
-
-## Usage
-
-### For Fine-Tuning
-```python
-import json
-
-# Load JSONL format
-with open('race_engineer_complete.jsonl', 'r') as f:
-    dataset = [json.loads(line) for line in f]
-```
-
-### For RAG/Vector Database
-```python
-import json
-
-# Load JSON format
-with open('race_engineer_complete.json', 'r') as f:
-    dataset = json.load(f)
-
-# Extract for embeddings
-for entry in dataset:
-    text = f"Q: {entry['question']}\\nA: {entry['answer']}"
-    # Create embeddings and store in vector DB
-```
-
-### Load Specific Category
-```python
-import json
-
-# Load only telemetry data
-with open('telemetry_complete.json', 'r') as f:
-    telemetry_data = json.load(f)
-```
-
-### Load Track-Specific Data
-```python
-import json
-
-# Load only Barber data
-with open('track_barber.json', 'r') as f:
-    barber_data = json.load(f)
-```
-
-## Entry Structure
-```json
-{
-  "id": "rag_0001",
-  "question": "What was the fastest lap time at Barber Race 1?",
-  "answer": "The fastest lap at Barber Race 1 was 95.234 seconds...",
-  "context": {
-    "category": "lap_times",
-    "subcategory": "fastest_lap",
-    "track": "barber",
-    "race": 1,
-    "difficulty": "intermediate",
-    "data_source": "lap_times"
-  },
-  "metadata": {
-    "source": "toyota_gr_cup_2025",
-    "domain": "motorsports_race_engineering",
-    "verified": true,
-    "created": "2025-11-23T..."
-  }
-}
-```
-
-## Data Quality
-- ✅ All entries extracted from real race data
-- ✅ Verified accuracy from official timing systems
-- ✅ Expert knowledge validated by racing professionals
-- ✅ Structured format for easy integration
-- ✅ Comprehensive coverage of race engineering topics
-
-## Applications
-1. **Fine-tuning LLMs** for race engineering assistance
-2. **RAG systems** for real-time race strategy
-3. **Chatbots** for driver coaching and telemetry analysis
-4. **Knowledge bases** for team training
-5. **Hybrid approaches** combining retrieval and generation
-
-## License
-Toyota GR Cup 2025 Dataset - For educational and research purposes
-
-## Generated By
-RaceIQ Multi-Track RAG Dataset Generator
-"""
+        levels = stats['difficulty_levels']
+        readme = _README_TEMPLATE.format_map({
+            'total_entries': stats['total_entries'],
+            'tracks_processed': self.stats['tracks_processed'],
+            'races_processed': self.stats['races_processed'],
+            'files_analyzed': self.stats['files_analyzed'],
+            'generated_date': stats['generated_date'][:10],
+            'beginner': levels['beginner'],
+            'intermediate': levels['intermediate'],
+            'advanced': levels['advanced'],
+            'categories_block': ''.join(f"- **{cat}**: {count} entries\n" for cat, count in sorted(stats['categories'].items())),
+            'sources_block': ''.join(f"- **{source}**: {count} entries\n" for source, count in sorted(stats['data_sources'].items())),
+            'pretty_files_block': "- `race_engineer_complete.json` - Human-readable format\n" if self.emit_pretty else "",
+            'category_files_block': ''.join(f"- `{cat}_complete.jsonl` - {count} entries\n" for cat, count in sorted(stats['categories'].items())),
+            'track_files_block': ''.join(f"- `track_{track}.jsonl` - {count} entries\n" for track, count in sorted(stats['tracks'].items())),
+        })
         
         with open('rag_dataset/COMPLETE_DATASET_README.md', 'w', encoding='utf-8') as f:
             f.write(readme)
-        print("  ✓ Saved COMPLETE_DATASET_README.md")
-
+        logger.info("  ✓ Saved COMPLETE_DATASET_README.md")
 
 def main():
-    print("🏁 Toyota GR Cup Complete RAG Dataset Generator")
-    print("=" * 70)
-    print("Extracting data from all 7 tracks and 14 races...")
-    print()
+    configure_logging(logging.WARNING if '--quiet' in sys.argv else logging.INFO)
+    logger.info("🏁 Toyota GR Cup Complete RAG Dataset Generator")
+    logger.info("=" * 70)
+    logger.info("Extracting data from all 7 tracks and 14 races...")
+    logger.info('')
     
-    generator = FullRAGDatasetGenerator()
+    generator = FullRAGDatasetGenerator(emit_pretty='--pretty' in sys.argv, use_cache='--no-cache' not in sys.argv)
     generator.generate_complete_dataset()
     
-    print("\n" + "=" * 70)
-    print("✅ Complete RAG Dataset Generation Finished!")
-    print("\nDataset ready for:")
-    print("  • Fine-tuning language models")
-    print("  • RAG vector databases")
-    print("  • Hybrid AI systems")
-    print("  • Race engineer training")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info("✅ Complete RAG Dataset Generation Finished!")
+    logger.info("\nDataset ready for:")
+    logger.info("  • Fine-tuning language models")
+    logger.info("  • RAG vector databases")
+    logger.info("  • Hybrid AI systems")
+    logger.info("  • Race engineer training")
+    logger.info("=" * 70)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,274 @@ Multi-Track Data Loader
 Unified interface for loading data from all 7 tracks
 """
 
+import numpy as np
 import pandas as pd
-import glob
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import fnmatch
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from src.track_config import get_track_info, get_track_file_path, list_available_tracks
 
+# pandas' default NA markers, so pyarrow reads the same cells as missing
+_NULL_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+# A timestamp format that never matches, so ISO timestamps stay text as with pd.read_csv
+_NO_TIMESTAMPS = ['%%never%%']
+_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+# Let pd.concat reuse the input blocks; pandas 3 copies lazily anyway and
+# deprecates the copy= keyword
+_CONCAT_NO_COPY = {'copy': False} if int(pd.__version__.split('.')[0]) < 3 else {}
+# Rows per read when downsampling telemetry
+_SAMPLE_CHUNK_ROWS = 500_000
+# Progress messages; RACEIQ_VERBOSE=0 turns them off (warnings and errors
+# are always printed)
+VERBOSE = os.environ.get('RACEIQ_VERBOSE', '1') != '0'
+
+# Known column types for the long-format lap time and telemetry exports. Only
+# columns whose inferred type is never in doubt are listed (value columns can
+# read as int or float, so they are left to inference); a file that breaks
+# these types falls back to pd.read_csv.
+_ID_COLUMN_TYPES = {
+    'lap': pa.int64(),
+    'outing': pa.int64(),
+    'vehicle_number': pa.int64(),
+    'vehicle_id': pa.string(),
+    'original_vehicle_id': pa.string(),
+    'meta_event': pa.string(),
+    'meta_session': pa.string(),
+    'meta_source': pa.string(),
+    'meta_time': pa.string(),
+    'timestamp': pa.string(),
+}
+LAP_TIME_COLUMN_TYPES = _ID_COLUMN_TYPES
+TELEMETRY_COLUMN_TYPES = {**_ID_COLUMN_TYPES, 'telemetry_name': pa.string()}
+
+
+def read_csv_fast(path: str, delimiter: str = ',',
+                  column_types: Optional[Dict[str, pa.DataType]] = None,
+                  columns: Optional[List[str]] = None,
+                  strip_columns: bool = False) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded parser into a pandas DataFrame
+    
+    Produces the same frame as pd.read_csv(path, delimiter=delimiter) for
+    well-formed files; anything pyarrow rejects (ragged rows, etc.) is
+    handed to pd.read_csv so its behaviour and errors are unchanged.
+    column_types pins the Arrow type of the named columns (when present),
+    skipping type inference for them. columns, if given, limits the read to
+    those columns (like usecols=), so the rest are never converted.
+    strip_columns trims whitespace from the header names as part of the read.
+    """
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    convert_options = pacsv.ConvertOptions(null_values=_NULL_VALUES, strings_can_be_null=True,
+                                           true_values=['True', 'TRUE', 'true'],
+                                           false_values=['False', 'FALSE', 'false'],
+                                           timestamp_parsers=_NO_TIMESTAMPS,
+                                           column_types=column_types or {},
+                                           include_columns=columns or [])
+    try:
+        table = pacsv.read_csv(path, read_options=_READ_OPTIONS, parse_options=parse_options,
+                               convert_options=convert_options)
+        # pyarrow still infers dates/times; re-read those columns as text
+        temporal = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+        if temporal:
+            convert_options.column_types = {**(column_types or {}), **temporal}
+            table = pacsv.read_csv(path, read_options=_READ_OPTIONS, parse_options=parse_options,
+                                   convert_options=convert_options)
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        return _read_csv_pandas(path, delimiter, columns, strip_columns)
+    if table.num_rows == 0:
+        # Header-only file: let pandas pick its (object) column dtypes
+        return _read_csv_pandas(path, delimiter, columns, strip_columns)
+    
+    if strip_columns:
+        table = table.rename_columns([name.strip() for name in table.column_names])
+    
+    # All-empty columns come back as null; pandas makes them float NaN
+    if any(pa.types.is_null(f.type) for f in table.schema):
+        table = table.cast(pa.schema([
+            pa.field(f.name, pa.float64()) if pa.types.is_null(f.type) else f for f in table.schema
+        ]))
+    return restore_missing_as_nan(table.to_pandas(self_destruct=True))
+
+
+def restore_missing_as_nan(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Missing cells of object columns as NaN, like pd.read_csv gives them
+    
+    Arrow's conversion (a pyarrow CSV read, a Parquet sidecar) leaves None
+    in object columns; df is updated in place and returned.
+    """
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].to_numpy()
+        missing = pd.isna(values)
+        if missing.any():
+            values = values.copy()
+            values[missing] = np.nan
+            df[col] = values
+    return df
+
+
+def _read_csv_pandas(path: str, delimiter: str, columns,
+                     strip_columns: bool) -> pd.DataFrame:
+    # Infer each column's dtype over the whole file (low_memory=True can
+    # give one column mixed types across chunks) and mmap the input
+    df = pd.read_csv(path, delimiter=delimiter, usecols=columns, engine='c',
+                     low_memory=False, memory_map=True)
+    if strip_columns:
+        df.rename(columns=str.strip, inplace=True)
+    return df
+
+
+def sniff_delimiter(path: str) -> str:
+    """';' if the header line has more semicolons than commas (results format), else ','"""
+    with open(path, 'rb') as f:
+        header = f.readline()
+    return ';' if header.count(b';') > header.count(b',') else ','
+
+
+def _read_lap_time_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    # Lap time exports are usually comma-delimited (telemetry format), some
+    # semicolon-delimited (results format); parse once with the right one
+    return read_csv_fast(path, delimiter=sniff_delimiter(path), column_types=LAP_TIME_COLUMN_TYPES,
+                         columns=columns, strip_columns=True)
+
+
+def _read_telemetry_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    # Telemetry files are always comma-delimited
+    return read_csv_fast(path, delimiter=',', column_types=TELEMETRY_COLUMN_TYPES,
+                         columns=columns, strip_columns=True)
+
+
+def _read_semicolon_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    # The timing exports pad header names, so project on the stripped names
+    # (and, like the unprojected read, tolerate columns a file doesn't have)
+    usecols = None
+    if columns is not None:
+        wanted = frozenset(columns)
+        usecols = lambda name: name.strip() in wanted
+    return _read_csv_pandas(path, ';', usecols, strip_columns=True)
+
+
+def parquet_sidecar_path(csv_path: str) -> str:
+    """Path of the Parquet copy kept next to a CSV file"""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def write_parquet_sidecar(reader, path: str) -> str:
+    """Parse path with reader once and store the frame as a sibling .parquet"""
+    sidecar = parquet_sidecar_path(path)
+    table = pa.Table.from_pandas(reader(path), preserve_index=False)
+    pq.write_table(table, sidecar, compression='zstd')
+    return sidecar
+
+
+def _read_with_sidecar(reader, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    # A sidecar older than its CSV is stale; ignore it and parse the CSV
+    sidecar = parquet_sidecar_path(path)
+    try:
+        if os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            return restore_missing_as_nan(pq.read_table(sidecar, columns=columns).to_pandas(self_destruct=True))
+    except (OSError, pa.ArrowException):
+        pass
+    return reader(path, columns=columns)
+
+
+def read_telemetry_sampled(path: str, sample_rate: int,
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Every sample_rate-th data row of a telemetry file (file lines N, 2N, ...)
+    
+    Reads in chunks of _SAMPLE_CHUNK_ROWS rows and keeps only the sampled
+    rows of each, carrying the row phase across chunks, so the full file is
+    never held in memory. Uses the Parquet sidecar while it is up to date.
+    """
+    sidecar = parquet_sidecar_path(path)
+    try:
+        if os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            parquet_file = pq.ParquetFile(sidecar)
+            schema = parquet_file.schema_arrow
+            if columns:
+                schema = pa.schema([schema.field(name) for name in columns])
+            offset = sample_rate - 1
+            batches = []
+            for batch in parquet_file.iter_batches(batch_size=_SAMPLE_CHUNK_ROWS, columns=columns):
+                batches.append(batch.take(np.arange(offset, batch.num_rows, sample_rate)))
+                offset = (offset - batch.num_rows) % sample_rate
+            return restore_missing_as_nan(pa.Table.from_batches(batches, schema=schema).to_pandas(self_destruct=True))
+    except (OSError, KeyError, pa.ArrowException):
+        pass
+    
+    usecols = None
+    if columns is not None:
+        wanted = frozenset(columns)
+        usecols = lambda name: name.strip() in wanted
+    offset = sample_rate - 1
+    parts = []
+    for chunk in pd.read_csv(path, delimiter=',', usecols=usecols, chunksize=_SAMPLE_CHUNK_ROWS):
+        parts.append(chunk.iloc[offset::sample_rate])
+        offset = (offset - len(chunk)) % sample_rate
+    df = pd.concat(parts, ignore_index=True, **_CONCAT_NO_COPY)
+    df.rename(columns=str.strip, inplace=True)
+    return df
+
+
+@lru_cache(maxsize=32)
+def _read_cached(reader, path: str, columns: Optional[Tuple[str, ...]],
+                 mtime_ns: int, size: int) -> pd.DataFrame:
+    return _read_with_sidecar(reader, path, list(columns) if columns else None)
+
+
+def load_csv_cached(reader, path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Parse path with reader (or load its up-to-date Parquet sidecar), reusing
+    the frame from an earlier call while the file's mtime and size are
+    unchanged. columns projects the read to just those columns.
+    
+    Meant for the small timing tables; telemetry is too large to keep and
+    is read uncached. Callers get a shallow copy: the metadata columns they
+    add land on the copy only, and the column data itself is shared.
+    """
+    stat = os.stat(path)
+    key_columns = tuple(columns) if columns else None
+    return _read_cached(reader, os.path.abspath(path), key_columns,
+                        stat.st_mtime_ns, stat.st_size).copy(deep=False)
+
+
+@lru_cache(maxsize=256)
+def _resolve_existing(base_path: str, track_base: str, filename: str) -> str:
+    """
+    First existing location of a track file, trying multiple base paths
+    
+    Found paths are memoized; a miss raises FileNotFoundError (and so is not
+    cached, letting a file that appears later be picked up).
+    """
+    possible_paths = (
+        os.path.join(base_path, track_base, filename),
+        os.path.join(track_base, filename),
+        filename
+    )
+    path = next((path for path in possible_paths if os.path.exists(path)), None)
+    if path is None:
+        raise FileNotFoundError(filename)
+    return path
+
+
+def add_track_metadata(df: pd.DataFrame, track_info, track_name: str, race_num: int) -> None:
+    """
+    Tag every row of df with its track and race
+    
+    The constant labels are single-category Categoricals (one code per row
+    instead of one string object per row) and race_number is int16.
+    """
+    codes = np.zeros(len(df), dtype=np.int8)
+    df['track_name'] = pd.Categorical.from_codes(codes, categories=[track_info.name])
+    df['track_short'] = pd.Categorical.from_codes(codes, categories=[track_name])
+    df['race_number'] = np.int16(race_num)
 
 class MultiTrackLoader:
     """Load and process data from multiple tracks"""
@@ -16,47 +278,76 @@ class MultiTrackLoader:
     def __init__(self, base_path: str = "."):
         self.base_path = base_path
         self.tracks = list_available_tracks()
+        # Directory listings for wildcard lookups, keyed by directory
+        self._dir_cache: Dict[str, List[str]] = {}
+    
+    def _glob(self, pattern: str, refresh: bool = False) -> List[str]:
+        """
+        Same matches as glob.glob(pattern) when the wildcards are in the file
+        name only. Each directory is listed once with os.scandir and the
+        listing reused; refresh=True re-lists it.
+        """
+        parent, name_pattern = os.path.split(pattern)
+        names = None if refresh else self._dir_cache.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent or os.curdir) as entries:
+                    names = [entry.name for entry in entries]
+            except OSError:
+                return []
+            self._dir_cache[parent] = names
+        
+        if not name_pattern.startswith('.'):
+            # Like glob, wildcards don't match hidden files
+            names = [name for name in names if not name.startswith('.')]
+        return [os.path.join(parent, name) for name in fnmatch.filter(names, name_pattern)]
     
-    def load_lap_times(self, track_name: str, race_num: int) -> pd.DataFrame:
-        """Load lap time data for a specific track and race"""
+    def _load_first_match(self, full_pattern: str, file_kind: str,
+                          columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the first file matching a semicolon-CSV pattern"""
+        listed = os.path.split(full_pattern)[0] in self._dir_cache
+        # A cached listing may be out of date; retry once with a fresh one
+        for refresh in (False, True):
+            if refresh and not listed:
+                break
+            files = self._glob(full_pattern, refresh)
+            if files:
+                try:
+                    return load_csv_cached(_read_semicolon_csv, files[0], columns)
+                except FileNotFoundError:
+                    if refresh or not listed:
+                        raise
+        
+        raise FileNotFoundError(f"No {file_kind} file found: {full_pattern}")
+    
+    def load_lap_times(self, track_name: str, race_num: int,
+                       columns: Optional[List[str]] = None,
+                       with_metadata: bool = True) -> pd.DataFrame:
+        """Load lap time data for a specific track and race (optionally only the given columns)"""
         track_info = get_track_info(track_name)
         filename = track_info.lap_time_pattern.format(race=race_num)
         
-        # Try multiple base paths
-        possible_paths = [
-            os.path.join(self.base_path, track_info.base_path, filename),
-            os.path.join(track_info.base_path, filename),
-            filename
-        ]
-        
-        full_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                full_path = path
-                break
-        
+        full_path = self._find_lap_time_file(track_info, filename)
         if not full_path:
             raise FileNotFoundError(f"Lap time file not found: {filename}")
         
-        try:
-            # Try comma delimiter first (telemetry format)
-            df = pd.read_csv(full_path, delimiter=',')
-        except:
-            # Fall back to semicolon (results format)
-            df = pd.read_csv(full_path, delimiter=';')
+        df = load_csv_cached(_read_lap_time_csv, full_path, columns)
         
-        # Clean column names
-        df.columns = df.columns.str.strip()
-        
-        # Add track metadata
-        df['track_name'] = track_info.name
-        df['track_short'] = track_name
-        df['race_number'] = race_num
+        if with_metadata:
+            add_track_metadata(df, track_info, track_name, race_num)
         
         return df
     
+    def _find_lap_time_file(self, track_info, filename: str) -> Optional[str]:
+        try:
+            return _resolve_existing(self.base_path, track_info.base_path, filename)
+        except FileNotFoundError:
+            return None
+    
     def load_telemetry(self, track_name: str, race_num: int, 
-                       sample_rate: Optional[int] = None) -> pd.DataFrame:
+                       sample_rate: Optional[int] = None,
+                       columns: Optional[List[str]] = None,
+                       with_metadata: bool = True) -> pd.DataFrame:
         """
         Load telemetry data for a specific track and race
         
@@ -64,120 +355,147 @@ class MultiTrackLoader:
             track_name: Track identifier
             race_num: Race number
             sample_rate: If provided, sample every Nth row to reduce memory
+            columns: If provided, only read these columns
+            with_metadata: Add the track_name/track_short/race_number columns
         """
         file_path = get_track_file_path(track_name, race_num, 'telemetry')
         full_path = os.path.join(self.base_path, file_path)
         
-        # Telemetry files are always comma-delimited
+        # Read once per call; these files are too large to hold in the cache
         if sample_rate:
-            # Read with sampling for large files
-            df = pd.read_csv(full_path, delimiter=',', 
-                           skiprows=lambda i: i % sample_rate != 0 and i != 0)
+            df = read_telemetry_sampled(full_path, sample_rate, columns)
         else:
-            df = pd.read_csv(full_path, delimiter=',')
+            df = _read_with_sidecar(_read_telemetry_csv, full_path, columns)
         
-        # Clean column names
-        df.columns = df.columns.str.strip()
-        
-        # Add track metadata
-        track_info = get_track_info(track_name)
-        df['track_name'] = track_info.name
-        df['track_short'] = track_name
-        df['race_number'] = race_num
+        if with_metadata:
+            add_track_metadata(df, get_track_info(track_name), track_name, race_num)
         
         return df
     
-    def load_results(self, track_name: str, race_num: int) -> pd.DataFrame:
+    def load_results(self, track_name: str, race_num: int,
+                   with_metadata: bool = True) -> pd.DataFrame:
         """Load race results"""
         pattern = get_track_file_path(track_name, race_num, 'results')
         full_pattern = os.path.join(self.base_path, pattern)
         
-        files = glob.glob(full_pattern)
-        if not files:
-            raise FileNotFoundError(f"No results file found: {full_pattern}")
-        
         # Use the first matching file (usually the official results)
-        df = pd.read_csv(files[0], delimiter=';')
-        df.columns = df.columns.str.strip()
+        df = self._load_first_match(full_pattern, 'results')
         
-        track_info = get_track_info(track_name)
-        df['track_name'] = track_info.name
-        df['track_short'] = track_name
-        df['race_number'] = race_num
+        if with_metadata:
+            add_track_metadata(df, get_track_info(track_name), track_name, race_num)
         
         return df
     
-    def load_analysis(self, track_name: str, race_num: int) -> pd.DataFrame:
-        """Load sector analysis data"""
+    def load_analysis(self, track_name: str, race_num: int,
+                      columns: Optional[List[str]] = None,
+                      with_metadata: bool = True) -> pd.DataFrame:
+        """Load sector analysis data (optionally only the given columns)"""
         pattern = get_track_file_path(track_name, race_num, 'analysis')
         full_pattern = os.path.join(self.base_path, pattern)
         
-        files = glob.glob(full_pattern)
-        if not files:
-            raise FileNotFoundError(f"No analysis file found: {full_pattern}")
-        
-        df = pd.read_csv(files[0], delimiter=';')
-        df.columns = df.columns.str.strip()
+        df = self._load_first_match(full_pattern, 'analysis', columns)
         
-        track_info = get_track_info(track_name)
-        df['track_name'] = track_info.name
-        df['track_short'] = track_name
-        df['race_number'] = race_num
+        if with_metadata:
+            add_track_metadata(df, get_track_info(track_name), track_name, race_num)
         
         return df
     
-    def load_best_laps(self, track_name: str, race_num: int) -> pd.DataFrame:
+    def load_best_laps(self, track_name: str, race_num: int,
+                       with_metadata: bool = True) -> pd.DataFrame:
         """Load best lap times by driver"""
         pattern = get_track_file_path(track_name, race_num, 'best_laps')
         full_pattern = os.path.join(self.base_path, pattern)
         
-        files = glob.glob(full_pattern)
-        if not files:
-            raise FileNotFoundError(f"No best laps file found: {full_pattern}")
+        df = self._load_first_match(full_pattern, 'best laps')
         
-        df = pd.read_csv(files[0], delimiter=';')
-        df.columns = df.columns.str.strip()
+        if with_metadata:
+            add_track_metadata(df, get_track_info(track_name), track_name, race_num)
         
+        return df
+    
+    def _csv_sources(self, track_name: str, race_num: int) -> List[Tuple[object, str]]:
+        """(reader, path) for every CSV the load_* methods read for a track/race"""
         track_info = get_track_info(track_name)
-        df['track_name'] = track_info.name
-        df['track_short'] = track_name
-        df['race_number'] = race_num
+        sources = []
         
-        return df
+        lap_time_file = self._find_lap_time_file(
+            track_info, track_info.lap_time_pattern.format(race=race_num))
+        if lap_time_file:
+            sources.append((_read_lap_time_csv, lap_time_file))
+        
+        telemetry_file = os.path.join(self.base_path, get_track_file_path(track_name, race_num, 'telemetry'))
+        if os.path.exists(telemetry_file):
+            sources.append((_read_telemetry_csv, telemetry_file))
+        
+        for file_type in ('results', 'analysis', 'best_laps'):
+            files = self._glob(os.path.join(self.base_path, get_track_file_path(track_name, race_num, file_type)))
+            if files:
+                sources.append((_read_semicolon_csv, files[0]))
+        
+        return sources
+    
+    def build_parquet_cache(self, race_nums: Tuple[int, ...] = (1, 2)) -> List[str]:
+        """
+        Convert every track's CSVs to Parquet sidecars once
+        
+        Later loads read the sidecar instead of parsing the CSV, until the
+        CSV is modified. Returns the paths written.
+        """
+        written = []
+        for track_name in self.tracks:
+            for race_num in race_nums:
+                for reader, path in self._csv_sources(track_name, race_num):
+                    try:
+                        written.append(write_parquet_sidecar(reader, path))
+                    except Exception as e:
+                        print(f"✗ Could not convert {path}: {e}")
+        return written
+    
+    def _load_each_track(self, load, race_num: int):
+        """Run load(track_name, race_num) for every track concurrently
+        
+        The CSV reads are I/O bound and pandas' parser releases the GIL, so
+        threads overlap them. Returns (track_name, future) pairs in track order.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(self.tracks))) as executor:
+            futures = [executor.submit(load, track_name, race_num) for track_name in self.tracks]
+        return list(zip(self.tracks, futures))
     
     def load_all_tracks_lap_times(self, race_num: int = 1) -> pd.DataFrame:
         """Load lap times from all tracks for comparison"""
         all_data = []
         
-        for track_name in self.tracks:
+        for track_name, future in self._load_each_track(self.load_lap_times, race_num):
             try:
-                df = self.load_lap_times(track_name, race_num)
+                df = future.result()
                 all_data.append(df)
-                print(f"✓ Loaded {track_name}: {len(df)} laps")
+                if VERBOSE:
+                    print(f"✓ Loaded {track_name}: {len(df)} laps")
             except Exception as e:
                 print(f"✗ Failed to load {track_name}: {e}")
         
         if not all_data:
             raise ValueError("No data loaded from any track")
         
-        return pd.concat(all_data, ignore_index=True)
+        return pd.concat(all_data, ignore_index=True, sort=False, **_CONCAT_NO_COPY)
     
     def load_all_tracks_results(self, race_num: int = 1) -> pd.DataFrame:
         """Load results from all tracks"""
         all_data = []
         
-        for track_name in self.tracks:
+        for track_name, future in self._load_each_track(self.load_results, race_num):
             try:
-                df = self.load_results(track_name, race_num)
+                df = future.result()
                 all_data.append(df)
-                print(f"✓ Loaded {track_name} results: {len(df)} entries")
+                if VERBOSE:
+                    print(f"✓ Loaded {track_name} results: {len(df)} entries")
             except Exception as e:
                 print(f"✗ Failed to load {track_name}: {e}")
         
         if not all_data:
             raise ValueError("No results loaded from any track")
         
-        return pd.concat(all_data, ignore_index=True)
+        return pd.concat(all_data, ignore_index=True, sort=False, **_CONCAT_NO_COPY)
     
     def get_track_statistics(self) -> pd.DataFrame:
         """Get statistics about all tracks"""
@@ -214,7 +532,7 @@ class MultiTrackLoader:
                     return path
                 
                 # Try glob pattern
-                files = glob.glob(path)
+                files = self._glob(path)
                 if files:
                     return files[0]
             
@@ -225,45 +543,51 @@ class MultiTrackLoader:
     
     def compare_vehicle_across_tracks(self, vehicle_id: str, race_num: int = 1) -> pd.DataFrame:
         """Compare a vehicle's performance across all tracks"""
-        results = []
+        vehicle_frames = []
         
         for track_name in self.tracks:
             try:
                 # Load lap times
-                lap_times = self.load_lap_times(track_name, race_num)
+                lap_times = self.load_lap_times(track_name, race_num, columns=['vehicle_id', 'value'])
                 
-                # Filter for this vehicle
-                vehicle_laps = lap_times[lap_times['vehicle_id'].str.contains(vehicle_id, na=False)]
+                # Filter for this vehicle, matching each distinct ID once
+                # rather than every lap (code -1, a missing ID, never matches)
+                codes, unique_ids = pd.factorize(lap_times['vehicle_id'])
+                id_matches = np.append(np.asarray(unique_ids.str.contains(vehicle_id, na=False), dtype=bool), False)
+                vehicle_laps = lap_times[id_matches[codes]]
                 
-                if len(vehicle_laps) > 0:
-                    track_info = get_track_info(track_name)
-                    
-                    # Calculate statistics
-                    if 'value' in vehicle_laps.columns:
-                        # Lap time in milliseconds
-                        lap_times_ms = vehicle_laps['value'].dropna()
-                        if len(lap_times_ms) > 0:
-                            results.append({
-                                'track': track_info.name,
-                                'track_short': track_name,
-                                'laps_completed': len(lap_times_ms),
-                                'best_lap_ms': lap_times_ms.min(),
-                                'best_lap_sec': lap_times_ms.min() / 1000,
-                                'avg_lap_ms': lap_times_ms.mean(),
-                                'avg_lap_sec': lap_times_ms.mean() / 1000,
-                                'track_length_km': track_info.length_km
-                            })
+                # Lap time in milliseconds
+                if len(vehicle_laps) > 0 and 'value' in vehicle_laps.columns:
+                    vehicle_frames.append(vehicle_laps[['track_short', 'value']])
             except Exception as e:
                 print(f"Could not load {track_name}: {e}")
         
-        if not results:
+        if not vehicle_frames:
+            return pd.DataFrame()
+        
+        # One grouped pass computes every track's statistics; observed=True
+        # keeps it to tracks with laps, as for plain string keys
+        stats = (pd.concat(vehicle_frames, ignore_index=True)
+                 .dropna(subset=['value'])
+                 .groupby('track_short', sort=False, observed=True)['value']
+                 .agg(laps_completed='count', best_lap_ms='min', avg_lap_ms='mean'))
+        if stats.empty:
             return pd.DataFrame()
         
-        df = pd.DataFrame(results)
+        track_infos = [get_track_info(track_name) for track_name in stats.index]
+        df = pd.DataFrame({
+            'track': [info.name for info in track_infos],
+            'track_short': stats.index.tolist(),
+            'laps_completed': stats['laps_completed'].to_numpy(),
+            'best_lap_ms': stats['best_lap_ms'].to_numpy(),
+            'best_lap_sec': stats['best_lap_ms'].to_numpy() / 1000,
+            'avg_lap_ms': stats['avg_lap_ms'].to_numpy(),
+            'avg_lap_sec': stats['avg_lap_ms'].to_numpy() / 1000,
+            'track_length_km': [info.length_km for info in track_infos]
+        })
         
         # Calculate average speed
-        if 'best_lap_sec' in df.columns and 'track_length_km' in df.columns:
-            df['avg_speed_kmh'] = (df['track_length_km'] / df['best_lap_sec']) * 3600
+        df['avg_speed_kmh'] = (df['track_length_km'] / df['best_lap_sec']) * 3600
         
         return df.sort_values('best_lap_sec')
 
@@ -6,7 +6,9 @@ question-answer pairs for training a conversational AI race engineer.
 
 import pandas as pd
 import numpy as np
-import json
+import orjson
+from collections import Counter
+from functools import cached_property
 from typing import List, Dict, Tuple
 import sys
 import os
@@ -15,8 +17,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from multi_track_loader import MultiTrackLoader
 from track_config import list_available_tracks, get_track_info
-from analysis.tire_degradation import TireDegradationAnalyzer
-from analysis.cross_track_analysis import CrossTrackAnalyzer
+
+# Fields shared by every dataset entry
+ENTRY_SOURCE = "toyota_gr_cup_telemetry"
+ENTRY_DOMAIN = "motorsports_race_engineering"
 
 
 class RaceEngineerRAGGenerator:
@@ -24,10 +28,22 @@ class RaceEngineerRAGGenerator:
     
     def __init__(self):
         self.loader = MultiTrackLoader()
-        self.tire_analyzer = TireDegradationAnalyzer()
-        self.cross_analyzer = CrossTrackAnalyzer()
         self.tracks = list_available_tracks()
-        self.dataset = []
+        # Columnar entry storage; source/domain are the same for every entry
+        self.questions: List[str] = []
+        self.answers: List[str] = []
+        self.contexts: List[Dict] = []
+    
+    # The analyzers are only built (and their modules imported) on first use
+    @cached_property
+    def tire_analyzer(self):
+        from analysis.tire_degradation import TireDegradationAnalyzer
+        return TireDegradationAnalyzer()
+    
+    @cached_property
+    def cross_analyzer(self):
+        from analysis.cross_track_analysis import CrossTrackAnalyzer
+        return CrossTrackAnalyzer()
     
     def generate_complete_dataset(self, output_file: str = "race_engineer_rag_dataset.jsonl"):
         """Generate complete RAG dataset from all available data"""
@@ -70,49 +86,55 @@ class RaceEngineerRAGGenerator:
         # Save dataset
         self.save_dataset(output_file)
         
-        print(f"\n✅ Dataset generated: {len(self.dataset)} entries")
+        print(f"\n✅ Dataset generated: {len(self.questions)} entries")
         print(f"📁 Saved to: {output_file}")
     
     def generate_track_insights(self):
         """Generate Q&A about track characteristics"""
+        entries = []
+        make_entry = self._make_entry
         
         for track_name in self.tracks:
             try:
                 track_info = get_track_info(track_name)
+                name, length_km, turns, direction = (
+                    track_info.name, track_info.length_km, track_info.turns, track_info.direction)
                 
                 # Basic track info
-                self.add_entry(
-                    question=f"What are the characteristics of {track_info.name}?",
-                    answer=f"{track_info.name} is a {track_info.length_km}km ({track_info.length_km * 0.621371:.2f} mile) circuit with {track_info.turns} turns, running {track_info.direction}. It's known for its technical layout and challenging corners.",
+                entries.append(make_entry(
+                    question=f"What are the characteristics of {name}?",
+                    answer=f"{name} is a {length_km}km ({length_km * 0.621371:.2f} mile) circuit with {turns} turns, running {direction}. It's known for its technical layout and challenging corners.",
                     context={
                         "track": track_name,
                         "category": "track_info",
                         "data_source": "track_config"
                     }
-                )
+                ))
                 
                 # Track difficulty
-                self.add_entry(
-                    question=f"How difficult is {track_info.name}?",
-                    answer=f"With {track_info.turns} turns over {track_info.length_km}km, {track_info.name} presents a {'highly technical' if track_info.turns > 15 else 'balanced'} challenge. The {track_info.direction} direction requires specific setup considerations.",
+                entries.append(make_entry(
+                    question=f"How difficult is {name}?",
+                    answer=f"With {turns} turns over {length_km}km, {name} presents a {'highly technical' if turns > 15 else 'balanced'} challenge. The {direction} direction requires specific setup considerations.",
                     context={
                         "track": track_name,
                         "category": "track_difficulty",
-                        "turns": track_info.turns,
-                        "length": track_info.length_km
+                        "turns": turns,
+                        "length": length_km
                     }
-                )
+                ))
                 
                 # Track comparison
-                if track_info.length_km > 5.0:
-                    self.add_entry(
-                        question=f"Is {track_info.name} a long or short track?",
-                        answer=f"{track_info.name} is a long circuit at {track_info.length_km}km. This means longer lap times, more fuel consumption, and greater tire degradation per lap. Strategy becomes crucial for managing resources.",
+                if length_km > 5.0:
+                    entries.append(make_entry(
+                        question=f"Is {name} a long or short track?",
+                        answer=f"{name} is a long circuit at {length_km}km. This means longer lap times, more fuel consumption, and greater tire degradation per lap. Strategy becomes crucial for managing resources.",
                         context={"track": track_name, "category": "track_length"}
-                    )
+                    ))
                 
             except Exception as e:
                 print(f"  ⚠️ Error processing {track_name}: {e}")
+        
+        self._add_entries(entries)
     
     def generate_lap_time_insights(self):
         """Generate Q&A about lap times and performance"""
@@ -179,26 +201,26 @@ class RaceEngineerRAGGenerator:
     
     def generate_sector_insights(self):
         """Generate Q&A about sector performance"""
+        sectors = ['S1', 'S2', 'S3']
         
         for track_name in self.tracks[:2]:  # Sample 2 tracks
             try:
-                analysis = self.loader.load_analysis(track_name, race_num=1)
+                analysis = self.loader.load_analysis(track_name, race_num=1, columns=sectors,
+                                                     with_metadata=False)
                 
-                if 'S1' in analysis.columns and 'S2' in analysis.columns and 'S3' in analysis.columns:
-                    # Sector time analysis
-                    s1_avg = analysis['S1'].mean()
-                    s2_avg = analysis['S2'].mean()
-                    s3_avg = analysis['S3'].mean()
-                    
-                    slowest_sector = max([('S1', s1_avg), ('S2', s2_avg), ('S3', s3_avg)], key=lambda x: x[1])
+                if all(sector in analysis.columns for sector in sectors):
+                    # Sector time analysis (one reduction over all three sectors)
+                    sector_avgs = analysis[sectors].mean()
+                    s1_avg, s2_avg, s3_avg = sector_avgs
+                    slowest_sector = sector_avgs.idxmax()
                     
                     self.add_entry(
                         question=f"Which sector is most challenging at {track_name}?",
-                        answer=f"At {track_name}, {slowest_sector[0]} is the most time-consuming sector with an average time of {slowest_sector[1]:.3f} seconds. This sector requires particular focus for lap time improvement. Sector times: S1={s1_avg:.3f}s, S2={s2_avg:.3f}s, S3={s3_avg:.3f}s.",
+                        answer=f"At {track_name}, {slowest_sector} is the most time-consuming sector with an average time of {sector_avgs[slowest_sector]:.3f} seconds. This sector requires particular focus for lap time improvement. Sector times: S1={s1_avg:.3f}s, S2={s2_avg:.3f}s, S3={s3_avg:.3f}s.",
                         context={
                             "track": track_name,
                             "category": "sector_analysis",
-                            "slowest_sector": slowest_sector[0]
+                            "slowest_sector": slowest_sector
                         }
                     )
                     
@@ -277,38 +299,58 @@ class RaceEngineerRAGGenerator:
             context={"category": "weather", "type": "wet_conditions"}
         )
     
+    @staticmethod
+    def _make_entry(question: str, answer: str, context: Dict) -> Tuple[str, str, Dict]:
+        """Build a Q&A entry for _add_entries without adding it to the dataset"""
+        return question, answer, context
+    
+    def _add_entries(self, entries: List[Tuple[str, str, Dict]]):
+        """Add a batch of (question, answer, context) entries to the dataset"""
+        if entries:
+            questions, answers, contexts = zip(*entries)
+            self.questions.extend(questions)
+            self.answers.extend(answers)
+            self.contexts.extend(contexts)
+    
     def add_entry(self, question: str, answer: str, context: Dict):
         """Add a Q&A entry to the dataset"""
-        entry = {
-            "question": question,
-            "answer": answer,
-            "context": context,
-            "source": "toyota_gr_cup_telemetry",
-            "domain": "motorsports_race_engineering"
-        }
-        self.dataset.append(entry)
+        self.questions.append(question)
+        self.answers.append(answer)
+        self.contexts.append(context)
+    
+    @property
+    def dataset(self) -> List[Dict]:
+        """The entries as dicts (built on demand from the columnar storage)"""
+        return [
+            {
+                "question": question,
+                "answer": answer,
+                "context": context,
+                "source": ENTRY_SOURCE,
+                "domain": ENTRY_DOMAIN
+            }
+            for question, answer, context in zip(self.questions, self.answers, self.contexts)
+        ]
     
     def save_dataset(self, output_file: str):
         """Save dataset in JSONL format for RAG training"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for entry in self.dataset:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        dataset = self.dataset
+        with open(output_file, 'wb') as f:
+            for entry in dataset:
+                f.write(orjson.dumps(entry) + b'\n')
         
         # Also save as regular JSON for easier viewing
         json_file = output_file.replace('.jsonl', '.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(self.dataset, f, indent=2, ensure_ascii=False)
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
     
     def generate_statistics(self):
         """Generate statistics about the dataset"""
-        categories = {}
-        for entry in self.dataset:
-            cat = entry['context'].get('category', 'unknown')
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = Counter(context.get('category', 'unknown') for context in self.contexts)
         
         print("\n📊 Dataset Statistics:")
         print("-" * 70)
-        print(f"Total entries: {len(self.dataset)}")
+        print(f"Total entries: {len(self.questions)}")
         print(f"\nBy category:")
         for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
             print(f"  {cat}: {count}")
@@ -6,9 +6,67 @@ Normalizes and cleans data for frontend consumption
 
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional, Tuple
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
+
+
+# (min, max) range each telemetry parameter is clipped to
+TELEMETRY_BOUNDS = {
+    'aps': (0, 100),              # Throttle/pedal position: 0-100%
+    'ath': (0, 100),
+    'pbrake_f': (0, 100),         # Brake pressure: 0-100 bar
+    'pbrake_r': (0, 100),
+    'Speed': (0, 250),            # Speed: 0-250 km/h (reasonable range)
+    'speed': (0, 250),
+    'Gear': (0, 6),               # Gear: 0-6
+    'gear': (0, 6),
+    'nmotor': (0, 8500),          # RPM: 0-8500
+    'nmot': (0, 8500),
+    'Steering_Angle': (-540, 540),  # Steering: -540 to 540 degrees
+    'accx_can': (-3, 3),          # G-forces: -3 to 3 G (reasonable range)
+    'accy_can': (-3, 3),
+}
+
+# Parameters that are whole numbers (truncated before clipping)
+INTEGER_PARAMETERS = {'Gear', 'gear'}
+
+# The long-format telemetry columns process_lap_telemetry uses; the channel
+# name and vehicle repeat on every row, so they are read as categoricals
+TELEMETRY_READ_COLUMNS = ['lap', 'meta_time', 'timestamp', 'vehicle_id', 'telemetry_name', 'telemetry_value']
+TELEMETRY_READ_DTYPES = {'telemetry_name': 'category', 'vehicle_id': 'category'}
+TELEMETRY_CHUNK_SIZE = 500000
+# Progress messages; RACEIQ_VERBOSE=0 turns them off (warnings and errors
+# are always printed)
+VERBOSE = os.environ.get('RACEIQ_VERBOSE', '1') != '0'
+
+
+@contextmanager
+def read_telemetry_chunks(telemetry_file: str):
+    """Chunked reader over the columns of a long-format telemetry CSV"""
+    with open(telemetry_file, 'rb') as f:
+        # The file is read front to back once; let the kernel read ahead
+        # aggressively (POSIX only)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with pd.read_csv(
+            f,
+            chunksize=TELEMETRY_CHUNK_SIZE,
+            usecols=TELEMETRY_READ_COLUMNS,
+            dtype=TELEMETRY_READ_DTYPES,
+            engine='c'
+        ) as reader:
+            yield reader
+
+
+def _pivot_lap_in_worker(cache_dir: str, lap_data: pd.DataFrame, lap: int) -> pd.DataFrame:
+    """Process-pool entry point for TelemetryProcessor.pivot_lap_rows"""
+    return TelemetryProcessor(cache_dir).pivot_lap_rows(lap_data, lap)
 
 
 class TelemetryProcessor:
@@ -38,7 +96,7 @@ class TelemetryProcessor:
     
     def get_cache_path(self, track: str, race: int, lap: int) -> str:
         """Get cache file path for processed telemetry"""
-        return os.path.join(self.cache_dir, f"{track}_R{race}_lap{lap}.csv")
+        return os.path.join(self.cache_dir, f"{track}_R{race}_lap{lap}.parquet")
     
     def is_cached(self, track: str, race: int, lap: int) -> bool:
         """Check if processed telemetry is cached"""
@@ -48,13 +106,15 @@ class TelemetryProcessor:
         """Load processed telemetry from cache"""
         cache_path = self.get_cache_path(track, race, lap)
         if os.path.exists(cache_path):
-            return pd.read_csv(cache_path)
+            # One block per column, like a freshly processed frame, instead
+            # of consolidating the columns into 2D blocks
+            return pq.read_table(cache_path).to_pandas(split_blocks=True)
         return None
     
     def save_to_cache(self, df: pd.DataFrame, track: str, race: int, lap: int):
         """Save processed telemetry to cache"""
         cache_path = self.get_cache_path(track, race, lap)
-        df.to_csv(cache_path, index=False)
+        df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
     
     def normalize_lap_number(self, lap: int) -> int:
         """Normalize lap number (handle error value 32768)"""
@@ -62,6 +122,19 @@ class TelemetryProcessor:
             return -1  # Invalid lap
         return lap
     
+    def lap_row_mask(self, laps: np.ndarray, lap: int) -> np.ndarray:
+        """Rows whose normalized lap number is lap (vectorized normalize_lap_number)"""
+        if lap == -1:
+            return (laps == 32768) | (laps < 0) | (laps > 100)
+        if self.normalize_lap_number(lap) != lap:
+            # An invalid lap number never matches once normalized
+            return np.zeros(len(laps), dtype=bool)
+        return laps == lap
+    
+    def lap_sample_positions(self, laps: np.ndarray, lap: int, sample_rate: int) -> np.ndarray:
+        """Positions of every sample_rate-th row of the lap, for a single iloc take"""
+        return np.flatnonzero(self.lap_row_mask(laps, lap))[::sample_rate]
+    
     def parse_vehicle_id(self, vehicle_id: str) -> Dict[str, str]:
         """Parse vehicle ID into chassis and car number"""
         # Format: GR86-004-78 (chassis: 004, car: 78)
@@ -76,6 +149,14 @@ class TelemetryProcessor:
             pass
         return {'chassis': 'unknown', 'car_number': 'unknown'}
     
+    def parse_vehicle_ids(self, vehicle_ids: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Vectorized parse_vehicle_id: (chassis, car_number) Series"""
+        parts = vehicle_ids.astype(str).str.split('-', expand=True).reindex(columns=range(3))
+        has_parts = parts[2].notna()
+        chassis = parts[1].where(has_parts, 'unknown')
+        car_number = parts[2].where(has_parts, 'unknown')
+        return chassis, car_number.mask(car_number == '000', 'unassigned')
+    
     def clean_telemetry_value(self, value, param_name: str) -> float:
         """Clean and normalize telemetry value"""
         try:
@@ -85,33 +166,63 @@ class TelemetryProcessor:
             if pd.isna(val) or np.isinf(val):
                 return self.get_default_value(param_name)
             
-            # Normalize specific parameters
-            if param_name in ['aps', 'ath']:
-                # Throttle/pedal position: 0-100%
-                return max(0, min(100, val))
-            elif param_name in ['pbrake_f', 'pbrake_r']:
-                # Brake pressure: 0-100 bar (normalize to 0-100)
-                return max(0, min(100, val))
-            elif param_name in ['Speed', 'speed']:
-                # Speed: 0-250 km/h (reasonable range)
-                return max(0, min(250, val))
-            elif param_name in ['Gear', 'gear']:
-                # Gear: 0-6
-                return max(0, min(6, int(val)))
-            elif param_name in ['nmotor', 'nmot']:
-                # RPM: 0-8500
-                return max(0, min(8500, val))
-            elif param_name == 'Steering_Angle':
-                # Steering: -540 to 540 degrees
-                return max(-540, min(540, val))
-            elif param_name in ['accx_can', 'accy_can']:
-                # G-forces: -3 to 3 G (reasonable range)
-                return max(-3, min(3, val))
+            # Normalize specific parameters to their valid range
+            if param_name in INTEGER_PARAMETERS:
+                val = int(val)
+            bounds = TELEMETRY_BOUNDS.get(param_name)
+            if bounds is not None:
+                low, high = bounds
+                return max(low, min(high, val))
             
             return val
         except:
             return self.get_default_value(param_name)
     
+    def clean_telemetry_series(self, values: pd.Series, param_name: str) -> np.ndarray:
+        """Vectorized clean_telemetry_value over a whole column"""
+        return self.clean_telemetry_columns({param_name: values})[param_name]
+    
+    def clean_telemetry_columns(self, columns, params: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        clean_telemetry_series over several columns in one fused pass
+        
+        The columns are stacked into one 2D buffer (a contiguous row per
+        parameter) so the default fill and the clip run once over all of
+        them, with per-parameter defaults and bounds.
+        
+        Args:
+            columns: DataFrame or {param: Series}
+            params: Parameters to clean (default: all columns)
+        
+        Returns:
+            {param: cleaned values}
+        """
+        if params is None:
+            params = list(columns.keys())
+        n_rows = len(columns[params[0]]) if params else 0
+        
+        # One owned buffer; every step below works on it in place
+        arr = np.empty((len(params), n_rows), dtype=np.float64)
+        for i, param in enumerate(params):
+            arr[i] = pd.to_numeric(columns[param], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        # NaN, infinite and unparseable values get the parameter's default
+        defaults = np.array([self.get_default_value(p) for p in params], dtype=np.float64)
+        np.copyto(arr, defaults[:, None], where=~np.isfinite(arr))
+        
+        integer = [i for i, p in enumerate(params) if p in INTEGER_PARAMETERS]
+        for i in integer:
+            np.trunc(arr[i], out=arr[i])
+        bounds = [TELEMETRY_BOUNDS.get(p, (-np.inf, np.inf)) for p in params]
+        low, high = np.array(bounds, dtype=np.float64).reshape(len(params), 2).T
+        np.clip(arr, low[:, None], high[:, None], out=arr)
+        
+        cleaned = {param: arr[i] for i, param in enumerate(params)}
+        # Gear fits in int8 once clipped to 0-6
+        for i in integer:
+            cleaned[params[i]] = arr[i].astype(np.int8)
+        return cleaned
+    
     def get_default_value(self, param_name: str) -> float:
         """Get default value for parameter"""
         defaults = {
@@ -158,51 +269,208 @@ class TelemetryProcessor:
         # Check cache first
         cached = self.load_from_cache(track, race, lap)
         if cached is not None:
-            print(f"✅ Loaded lap {lap} from cache")
+            if VERBOSE:
+                print(f"✅ Loaded lap {lap} from cache")
             return cached
         
-        print(f"🔄 Processing lap {lap} from {telemetry_file}...")
+        if VERBOSE:
+            print(f"🔄 Processing lap {lap} from {telemetry_file}...")
         
         # Read file in chunks, filter for lap, and sample
-        chunk_size = 500000
-        lap_data_chunks = []
+        with read_telemetry_chunks(telemetry_file) as reader:
+            lap_data_chunks = self.collect_lap_rows(reader, [lap], sample_rate)[lap]
+        
+        if not lap_data_chunks:
+            print(f"   ⚠️  No data found for lap {lap}")
+            return pd.DataFrame()
+        
+        pivoted = self.build_lap_frame(lap_data_chunks, lap)
+        
+        # Cache the result
+        self.save_to_cache(pivoted, track, race, lap)
+        
+        return pivoted
+    
+    def collect_lap_rows(self, reader, laps: List[int], sample_rate: int) -> Dict[int, List[pd.DataFrame]]:
+        """
+        Sampled rows of each lap, gathered in one pass over a chunk reader
+        
+        A lap stops collecting at the first chunk without it after chunks
+        with it (lap data is contiguous), or once more than three chunks'
+        worth of rows have been read; reading stops when every lap has.
+        
+        Returns:
+            {lap: sampled chunks}, an empty list for laps without data
+        """
+        lap_data_chunks = {lap: [] for lap in laps}
+        active = list(laps)
         rows_processed = 0
         
-        for chunk in pd.read_csv(telemetry_file, chunksize=chunk_size):
+        for chunk in reader:
             rows_processed += len(chunk)
+            chunk_laps = chunk['lap'].to_numpy()
+            
+            for lap in list(active):
+                # Take the sampled rows directly rather than the whole lap first
+                positions = self.lap_sample_positions(chunk_laps, lap, sample_rate)
+                
+                if not positions.size:
+                    if lap_data_chunks[lap]:
+                        active.remove(lap)
+                    continue
+                
+                lap_chunk = chunk.iloc[positions]
+                lap_data_chunks[lap].append(lap_chunk)
+                if VERBOSE:
+                    print(f"   Found {len(lap_chunk)} points (processed {rows_processed:,} rows)")
+                
+                # Stop if we have enough data (assume lap data is contiguous)
+                if rows_processed > TELEMETRY_CHUNK_SIZE * 3:
+                    active.remove(lap)
+            
+            if not active:
+                break
+        
+        return lap_data_chunks
+    
+    def process_many_laps(
+        self,
+        telemetry_file: str,
+        laps: List[int],
+        track: str,
+        race: int,
+        sample_rate: int = 50,
+        workers: Optional[int] = None
+    ) -> Dict[int, pd.DataFrame]:
+        """
+        Process several laps of one telemetry file
+        
+        The file is read once for every lap that isn't cached, with the same
+        stopping rule as process_lap_telemetry, so each lap comes out (and is
+        cached) exactly as that method would produce it. Only the key
+        parameter rows are passed on for pivoting and normalizing.
+        
+        Args:
+            laps: Lap numbers to extract
+            workers: Pivot the laps in this many worker processes (default:
+                in this process)
+            (other arguments as for process_lap_telemetry)
+        
+        Returns:
+            {lap: DataFrame with normalized telemetry}, empty for laps without data
+        """
+        results = {}
+        pending = []
+        for lap in dict.fromkeys(laps):
+            cached = self.load_from_cache(track, race, lap)
+            if cached is not None:
+                if VERBOSE:
+                    print(f"✅ Loaded lap {lap} from cache")
+                results[lap] = cached
+            else:
+                pending.append(lap)
+        
+        if pending:
+            if VERBOSE:
+                print(f"🔄 Processing laps {pending} from {telemetry_file}...")
             
-            # Normalize lap numbers
-            chunk['lap_normalized'] = chunk['lap'].apply(self.normalize_lap_number)
+            # One pass over the file collects (and samples) every pending lap
+            with read_telemetry_chunks(telemetry_file) as reader:
+                lap_data_chunks = self.collect_lap_rows(reader, pending, sample_rate)
             
-            # Filter for target lap
-            lap_chunk = chunk[chunk['lap_normalized'] == lap].copy()
+            found = [lap for lap in pending if lap_data_chunks[lap]]
+            for lap in pending:
+                if not lap_data_chunks[lap]:
+                    print(f"   ⚠️  No data found for lap {lap}")
+                    results[lap] = pd.DataFrame()
             
-            if not lap_chunk.empty:
-                # Sample to reduce data
-                lap_chunk = lap_chunk.iloc[::sample_rate]
-                lap_data_chunks.append(lap_chunk)
-                print(f"   Found {len(lap_chunk)} points (processed {rows_processed:,} rows)")
+            # Drop the other channels here so workers only receive key rows
+            key_rows = []
+            for lap in found:
+                if VERBOSE:
+                    print(f"   Combined {sum(map(len, lap_data_chunks[lap]))} data points")
+                key_rows.append(self.combine_key_rows(lap_data_chunks[lap]))
+            del lap_data_chunks
             
-            # Stop if we have enough data (assume lap data is contiguous)
-            if len(lap_data_chunks) > 0 and rows_processed > chunk_size * 3:
-                break
+            workers = min(len(found), workers or 1)
+            if workers >= 2:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    frames = list(executor.map(partial(_pivot_lap_in_worker, self.cache_dir),
+                                               key_rows, found))
+            else:
+                frames = [self.pivot_lap_rows(lap_data, lap) for lap_data, lap in zip(key_rows, found)]
+            
+            for lap, pivoted in zip(found, frames):
+                self.save_to_cache(pivoted, track, race, lap)
+                results[lap] = pivoted
         
-        if not lap_data_chunks:
-            print(f"   ⚠️  No data found for lap {lap}")
-            return pd.DataFrame()
+        return {lap: results[lap] for lap in dict.fromkeys(laps)}
+    
+    def combine_key_rows(self, lap_data_chunks: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine the key-parameter rows of the chunks into one long-format frame
         
+        Only the key parameters are kept, so the other rows are dropped before
+        combining. The rows are copied straight into buffers sized for the
+        result instead of going through pd.concat.
+        """
+        string_cols = ['meta_time', 'timestamp', 'vehicle_id']
+        
+        selections = []
+        for chunk in lap_data_chunks:
+            codes = pd.Categorical(chunk['telemetry_name'], categories=self.KEY_PARAMETERS).codes
+            selections.append((chunk, codes >= 0, codes))
+        total = sum(int(key_rows.sum()) for _, key_rows, _ in selections)
+        
+        buffers = {col: np.empty(total, dtype=object) for col in string_cols}
+        values = np.empty(total, dtype=np.result_type(*(c['telemetry_value'].dtype for c in lap_data_chunks)))
+        name_codes = np.empty(total, dtype=np.int8)
+        
+        offset = 0
+        for chunk, key_rows, codes in selections:
+            end = offset + int(key_rows.sum())
+            for col in string_cols:
+                buffers[col][offset:end] = np.asarray(chunk[col].array[key_rows], dtype=object)
+            values[offset:end] = chunk['telemetry_value'].to_numpy()[key_rows]
+            name_codes[offset:end] = codes[key_rows]
+            offset = end
+        
+        columns = {}
+        for col in string_cols:
+            # Each chunk has its own categories, so categorical columns
+            # come back as their plain values
+            dtype = lap_data_chunks[0][col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                dtype = dtype.categories.dtype
+            columns[col] = pd.Series(buffers[col], dtype=dtype, copy=False)
+        columns['telemetry_name'] = pd.Categorical.from_codes(name_codes, categories=self.KEY_PARAMETERS)
+        columns['telemetry_value'] = values
+        return pd.DataFrame(columns, copy=False)
+    
+    def build_lap_frame(self, lap_data_chunks: List[pd.DataFrame], lap: int) -> pd.DataFrame:
+        """Pivot, clean and enrich the sampled long-format rows of one lap"""
         # Combine chunks
-        lap_data = pd.concat(lap_data_chunks, ignore_index=True)
-        print(f"   Combined {len(lap_data)} data points")
-        
+        if VERBOSE:
+            print(f"   Combined {sum(map(len, lap_data_chunks))} data points")
+        return self.pivot_lap_rows(self.combine_key_rows(lap_data_chunks), lap)
+    
+    def pivot_lap_rows(self, lap_data: pd.DataFrame, lap: int) -> pd.DataFrame:
+        """Pivot, clean and enrich the key-parameter rows of one lap (see combine_key_rows)"""
         # Pivot from long to wide format
-        print(f"   Pivoting data...")
-        pivoted = lap_data.pivot_table(
-            index=['meta_time', 'timestamp', 'vehicle_id'],
-            columns='telemetry_name',
-            values='telemetry_value',
-            aggfunc='first'
-        ).reset_index()
+        if VERBOSE:
+            print(f"   Pivoting data...")
+        # groupby().first().unstack() is pivot_table(aggfunc='first') without
+        # its generic aggregation machinery; the dropna calls match its
+        # default of dropping all-NaN rows and columns
+        pivoted = (
+            lap_data.groupby(['meta_time', 'timestamp', 'vehicle_id', 'telemetry_name'], observed=True)['telemetry_value']
+            .first()
+            .unstack('telemetry_name')
+            .dropna(how='all')
+            .dropna(axis=1, how='all')
+            .reset_index()
+        )
         
         # Keep only key parameters
         available_params = [p for p in self.KEY_PARAMETERS if p in pivoted.columns]
@@ -210,19 +478,13 @@ class TelemetryProcessor:
         pivoted = pivoted[keep_cols]
         
         # Clean and normalize values
-        print(f"   Normalizing {len(available_params)} parameters...")
-        for param in available_params:
-            pivoted[param] = pivoted[param].apply(
-                lambda x: self.clean_telemetry_value(x, param)
-            )
-        
-        # Parse vehicle info
-        pivoted['chassis'] = pivoted['vehicle_id'].apply(
-            lambda x: self.parse_vehicle_id(x)['chassis']
-        )
-        pivoted['car_number'] = pivoted['vehicle_id'].apply(
-            lambda x: self.parse_vehicle_id(x)['car_number']
-        )
+        if VERBOSE:
+            print(f"   Normalizing {len(available_params)} parameters...")
+        for param, values in self.clean_telemetry_columns(pivoted, available_params).items():
+            pivoted[param] = values
+        
+        # Parse vehicle info (vectorized parse_vehicle_id)
+        pivoted['chassis'], pivoted['car_number'] = self.parse_vehicle_ids(pivoted['vehicle_id'])
         
         # Add computed fields
         if 'pbrake_f' in pivoted.columns and 'pbrake_r' in pivoted.columns:
@@ -237,10 +499,8 @@ class TelemetryProcessor:
         # Add progress through lap (0-1)
         pivoted['lap_progress'] = np.linspace(0, 1, len(pivoted))
         
-        print(f"   ✅ Processed {len(pivoted)} points for lap {lap}")
-        
-        # Cache the result
-        self.save_to_cache(pivoted, track, race, lap)
+        if VERBOSE:
+            print(f"   ✅ Processed {len(pivoted)} points for lap {lap}")
         
         return pivoted
     
@@ -258,26 +518,14 @@ class TelemetryProcessor:
         Returns:
             (telemetry_df, fastest_lap_number)
         """
-        # Find fastest lap from analysis data
-        def parse_lap_time(time_str):
-            try:
-                parts = str(time_str).split(':')
-                if len(parts) == 2:
-                    return float(parts[0]) * 60 + float(parts[1])
-                return float(time_str)
-            except:
-                return 999999
-        
-        analysis_data['lap_time_seconds'] = analysis_data['LAP_TIME'].apply(parse_lap_time)
-        valid_laps = analysis_data[analysis_data['lap_time_seconds'] < 180]
-        
-        if valid_laps.empty:
+        fastest_lap = self.find_fastest_lap(analysis_data)
+        if fastest_lap is None:
             return pd.DataFrame(), -1
         
-        fastest_lap = valid_laps.loc[valid_laps['lap_time_seconds'].idxmin()]
         fastest_lap_num = int(fastest_lap['LAP_NUMBER'])
         
-        print(f"🏆 Fastest lap: {fastest_lap_num} ({fastest_lap['lap_time_seconds']:.3f}s)")
+        if VERBOSE:
+            print(f"🏆 Fastest lap: {fastest_lap_num} ({fastest_lap['lap_time_seconds']:.3f}s)")
         
         # Get telemetry for that lap
         telemetry = self.process_lap_telemetry(
@@ -290,6 +538,40 @@ class TelemetryProcessor:
         
         return telemetry, fastest_lap_num
     
+    def find_fastest_lap(self, analysis_data: pd.DataFrame) -> Optional[pd.Series]:
+        """
+        Analysis row of the fastest valid (under 180s) lap, None if there is none
+        
+        Adds the parsed lap_time_seconds column to analysis_data.
+        """
+        def parse_lap_time(time_str):
+            try:
+                parts = str(time_str).split(':')
+                if len(parts) == 2:
+                    return float(parts[0]) * 60 + float(parts[1])
+                return float(time_str)
+            except:
+                return 999999
+        
+        # Vectorized "M:SS.sss" / plain-seconds parse; any value it can't
+        # read goes through parse_lap_time for the exact scalar behaviour
+        lap_time_text = analysis_data['LAP_TIME'].astype(str)
+        parts = lap_time_text.str.split(':', expand=True).reindex(columns=range(3))
+        minutes_seconds = parts[1].notna() & parts[2].isna()
+        lap_seconds = (
+            pd.to_numeric(parts[0], errors='coerce') * 60 + pd.to_numeric(parts[1], errors='coerce')
+        ).where(minutes_seconds, pd.to_numeric(lap_time_text.where(parts[1].isna()), errors='coerce'))
+        unparsed = lap_seconds.isna()
+        if unparsed.any():
+            lap_seconds[unparsed] = analysis_data.loc[unparsed, 'LAP_TIME'].map(parse_lap_time)
+        analysis_data['lap_time_seconds'] = lap_seconds
+        valid_laps = analysis_data[analysis_data['lap_time_seconds'] < 180]
+        
+        if valid_laps.empty:
+            return None
+        
+        return valid_laps.loc[valid_laps['lap_time_seconds'].idxmin()]
+    
     def calculate_optimal_metrics(self, telemetry: pd.DataFrame) -> Dict:
         """Calculate average metrics from optimal lap telemetry"""
         if telemetry.empty:
@@ -301,60 +583,44 @@ class TelemetryProcessor:
                 'avg_rpm': 6000.0
             }
         
+        def column(*names):
+            # First of the names present as a float ndarray, else None
+            for name in names:
+                if name in telemetry.columns:
+                    return telemetry[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            return None
+        
+        def positive(values):
+            # Values above zero (drops zeros, negatives and NaN)
+            return values[values > 0] if values is not None else values
+        
+        def mean(values, default):
+            # NaN-skipping mean like Series.mean(); the default when the column is absent
+            if values is None:
+                return default
+            values = values[~np.isnan(values)]
+            return float(values.mean()) if values.size else float('nan')
+        
         metrics = {}
         
         # Speed - filter out zeros and invalid values
-        if 'speed' in telemetry.columns:
-            valid_speed = telemetry['speed'][telemetry['speed'] > 0]
-            if len(valid_speed) > 0:
-                metrics['avg_speed'] = float(valid_speed.mean())
-                metrics['max_speed'] = float(valid_speed.max())
-            else:
-                metrics['avg_speed'] = 140.0
-                metrics['max_speed'] = 180.0
-        elif 'Speed' in telemetry.columns:
-            valid_speed = telemetry['Speed'][telemetry['Speed'] > 0]
-            if len(valid_speed) > 0:
-                metrics['avg_speed'] = float(valid_speed.mean())
-                metrics['max_speed'] = float(valid_speed.max())
-            else:
-                metrics['avg_speed'] = 140.0
-                metrics['max_speed'] = 180.0
+        valid_speed = positive(column('speed', 'Speed'))
+        if valid_speed is not None and valid_speed.size:
+            metrics['avg_speed'] = float(valid_speed.mean())
+            metrics['max_speed'] = float(valid_speed.max())
         else:
             metrics['avg_speed'] = 140.0
             metrics['max_speed'] = 180.0
         
         # Throttle
-        if 'throttle' in telemetry.columns:
-            metrics['avg_throttle'] = float(telemetry['throttle'].mean())
-        elif 'aps' in telemetry.columns:
-            metrics['avg_throttle'] = float(telemetry['aps'].mean())
-        else:
-            metrics['avg_throttle'] = 75.0
+        metrics['avg_throttle'] = mean(column('throttle', 'aps'), 75.0)
         
         # Brake
-        if 'brake_total' in telemetry.columns:
-            metrics['avg_brake'] = float(telemetry['brake_total'].mean())
-        elif 'pbrake_f' in telemetry.columns:
-            metrics['avg_brake'] = float(telemetry['pbrake_f'].mean())
-        else:
-            metrics['avg_brake'] = 20.0
+        metrics['avg_brake'] = mean(column('brake_total', 'pbrake_f'), 20.0)
         
         # RPM
-        if 'nmot' in telemetry.columns:
-            valid_rpm = telemetry['nmot'][telemetry['nmot'] > 0]
-            if len(valid_rpm) > 0:
-                metrics['avg_rpm'] = float(valid_rpm.mean())
-            else:
-                metrics['avg_rpm'] = 6000.0
-        elif 'nmotor' in telemetry.columns:
-            valid_rpm = telemetry['nmotor'][telemetry['nmotor'] > 0]
-            if len(valid_rpm) > 0:
-                metrics['avg_rpm'] = float(valid_rpm.mean())
-            else:
-                metrics['avg_rpm'] = 6000.0
-        else:
-            metrics['avg_rpm'] = 6000.0
+        valid_rpm = positive(column('nmot', 'nmotor'))
+        metrics['avg_rpm'] = float(valid_rpm.mean()) if valid_rpm is not None and valid_rpm.size else 6000.0
         
         return metrics
     
@@ -363,23 +629,40 @@ class TelemetryProcessor:
         if telemetry.empty:
             return []
         
-        records = []
-        for _, row in telemetry.iterrows():
-            record = {
-                'timestamp': str(row.get('meta_time', '')),
-                'progress': float(row.get('lap_progress', 0)),
-                'speed': float(row.get('speed', row.get('Speed', 0))),
-                'throttle': float(row.get('throttle', row.get('aps', 0))),
-                'brake': float(row.get('brake_total', row.get('pbrake_f', 0))),
-                'gear': int(row.get('gear', row.get('Gear', 4))),
-                'rpm': float(row.get('nmot', row.get('nmotor', 5000))),
-                'steering': float(row.get('Steering_Angle', 0)),
-                'accel_x': float(row.get('accx_can', 0)),
-                'accel_y': float(row.get('accy_can', 0)),
+        def column(names, default):
+            # First of the names present, as plain Python values; else the default
+            for name in names:
+                if name in telemetry.columns:
+                    return telemetry[name].tolist()
+            return [default] * len(telemetry)
+        
+        columns = zip(
+            column(['meta_time'], ''),
+            column(['lap_progress'], 0),
+            column(['speed', 'Speed'], 0),
+            column(['throttle', 'aps'], 0),
+            column(['brake_total', 'pbrake_f'], 0),
+            column(['gear', 'Gear'], 4),
+            column(['nmot', 'nmotor'], 5000),
+            column(['Steering_Angle'], 0),
+            column(['accx_can'], 0),
+            column(['accy_can'], 0),
+        )
+        return [
+            {
+                'timestamp': str(timestamp),
+                'progress': float(progress),
+                'speed': float(speed),
+                'throttle': float(throttle),
+                'brake': float(brake),
+                'gear': int(gear),
+                'rpm': float(rpm),
+                'steering': float(steering),
+                'accel_x': float(accel_x),
+                'accel_y': float(accel_y),
             }
-            records.append(record)
-        
-        return records
+            for timestamp, progress, speed, throttle, brake, gear, rpm, steering, accel_x, accel_y in columns
+        ]
 
 
 # Singleton instance
@@ -4,7 +4,8 @@ Handles all 7 tracks in the Toyota GR Cup dataset
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 @dataclass
@@ -34,6 +35,21 @@ class TrackInfo:
     lat_max: Optional[float] = None
     lon_min: Optional[float] = None
     lon_max: Optional[float] = None
+    
+    # File type -> filename pattern, built from the *_pattern fields
+    file_patterns: Dict[str, str] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.file_patterns = {
+            'lap_time': self.lap_time_pattern,
+            'lap_start': self.lap_start_pattern,
+            'lap_end': self.lap_end_pattern,
+            'telemetry': self.telemetry_pattern,
+            'results': self.results_pattern,
+            'analysis': self.analysis_pattern,
+            'weather': self.weather_pattern,
+            'best_laps': self.best_laps_pattern
+        }
 
 
 # Track Database
@@ -173,14 +189,24 @@ TRACKS: Dict[str, TrackInfo] = {
 }
 
 
+def normalize_track_name(track_name: str) -> str:
+    """Track key for a display or path-style name ('Road America' -> 'road_america')"""
+    return track_name.lower().replace(" ", "_").replace("-", "_")
+
+
+# TRACKS keyed by normalized name, built once
+_NORM_TRACKS: Dict[str, TrackInfo] = {normalize_track_name(k): v for k, v in TRACKS.items()}
+
+
+@lru_cache(maxsize=64)
 def get_track_info(track_name: str) -> TrackInfo:
     """Get track configuration by name"""
-    track_name = track_name.lower().replace(" ", "_").replace("-", "_")
+    track_name = normalize_track_name(track_name)
     
-    if track_name not in TRACKS:
+    if track_name not in _NORM_TRACKS:
         raise ValueError(f"Unknown track: {track_name}. Available: {list(TRACKS.keys())}")
     
-    return TRACKS[track_name]
+    return _NORM_TRACKS[track_name]
 
 
 def list_available_tracks() -> List[str]:
@@ -188,6 +214,7 @@ def list_available_tracks() -> List[str]:
     return list(TRACKS.keys())
 
 
+@lru_cache(maxsize=256)
 def get_track_file_path(track_name: str, race_num: int, file_type: str) -> str:
     """
     Get the full path to a specific data file
@@ -209,27 +236,11 @@ def get_track_file_path(track_name: str, race_num: int, file_type: str) -> str:
         folder = track.race_folders[race_num - 1]
     
     # Get the pattern for this file type
-    pattern_map = {
-        'lap_time': track.lap_time_pattern,
-        'lap_start': track.lap_start_pattern,
-        'lap_end': track.lap_end_pattern,
-        'telemetry': track.telemetry_pattern,
-        'results': track.results_pattern,
-        'analysis': track.analysis_pattern,
-        'weather': track.weather_pattern,
-        'best_laps': track.best_laps_pattern
-    }
-    
-    if file_type not in pattern_map:
+    if file_type not in track.file_patterns:
         raise ValueError(f"Unknown file type: {file_type}")
     
-    pattern = pattern_map[file_type].format(race=race_num)
-    
-    # For glob patterns, return the pattern
-    if '*' in pattern:
-        return os.path.join(folder, pattern)
-    
-    return os.path.join(folder, pattern)
+    # Glob patterns are returned as-is, for the caller to expand
+    return os.path.join(folder, track.file_patterns[file_type].format(race=race_num))
 
 
 def get_all_tracks_summary() -> Dict:
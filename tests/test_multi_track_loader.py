@@ -0,0 +1,86 @@
+"""Tests for MultiTrackLoader"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from src.multi_track_loader import MultiTrackLoader, _read_cached, parquet_sidecar_path
+
+
+def write_lap_times(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ['vehicle_id,lap,value'] + [f"{vehicle_id},{lap},{value}" for vehicle_id, lap, value in rows]
+    path.write_text('\n'.join(lines) + '\n')
+
+
+@pytest.fixture
+def track_data(tmp_path, monkeypatch):
+    # The loader also looks for files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_compare_vehicle_skips_track_with_only_missing_lap_times(track_data):
+    write_lap_times(track_data / 'barber' / 'R1_barber_lap_time.csv', [
+        ('GR86-002-7', 1, ''),
+        ('GR86-002-7', 2, ''),
+        ('GR86-004-78', 1, 99000),
+    ])
+    write_lap_times(track_data / 'indianapolis' / 'R1_indianapolis_motor_speedway_lap_time.csv', [
+        ('GR86-002-7', 1, 101000),
+        ('GR86-002-7', 2, 100000),
+    ])
+    
+    result = MultiTrackLoader(base_path=str(track_data)).compare_vehicle_across_tracks('GR86-002', 1)
+    
+    assert result['track_short'].tolist() == ['indianapolis']
+    assert result['laps_completed'].tolist() == [2]
+    assert result['best_lap_ms'].tolist() == [100000]
+
+
+def test_compare_vehicle_with_only_missing_lap_times_is_empty(track_data):
+    write_lap_times(track_data / 'barber' / 'R1_barber_lap_time.csv', [
+        ('GR86-002-7', 1, ''),
+        ('GR86-002-7', 2, ''),
+    ])
+    
+    result = MultiTrackLoader(base_path=str(track_data)).compare_vehicle_across_tracks('GR86-002', 1)
+    
+    assert result.empty
+
+
+def assert_same_cells(actual: pd.DataFrame, expected: pd.DataFrame):
+    # DataFrame.equals treats None and NaN alike; compare the cells themselves
+    assert list(actual.columns) == list(expected.columns)
+    assert list(actual.dtypes) == list(expected.dtypes)
+    for col in expected.columns:
+        for got, want in zip(actual[col], expected[col]):
+            if isinstance(want, float) and math.isnan(want):
+                assert isinstance(got, float) and math.isnan(got), (col, got)
+            else:
+                assert got == want, (col, got, want)
+
+
+def test_parquet_sidecar_round_trips_missing_string_cells(track_data):
+    analysis_file = track_data / 'barber' / '23_AnalysisEndurance_Race 1.CSV'
+    analysis_file.parent.mkdir(parents=True)
+    analysis_file.write_text('NUMBER; DRIVER ;LAP_TIME;FLAG\n1;Ann;1:30.100;\n2;;;FCY\n3;Bob;1:31.000;\n')
+    write_lap_times(track_data / 'barber' / 'R1_barber_lap_time.csv', [
+        ('GR86-002-7', 1, 99000),
+        ('', 2, 98000),
+    ])
+    
+    loader = MultiTrackLoader(base_path=str(track_data))
+    fresh_analysis = loader.load_analysis('barber', 1, with_metadata=False)
+    fresh_lap_times = loader.load_lap_times('barber', 1, with_metadata=False)
+    expected = pd.read_csv(analysis_file, delimiter=';').rename(columns=str.strip)
+    assert_same_cells(fresh_analysis, expected)
+    
+    written = loader.build_parquet_cache(race_nums=(1,))
+    assert parquet_sidecar_path(str(analysis_file)) in written
+    _read_cached.cache_clear()
+    
+    assert_same_cells(loader.load_analysis('barber', 1, with_metadata=False), fresh_analysis)
+    assert_same_cells(loader.load_lap_times('barber', 1, with_metadata=False), fresh_lap_times)
+    assert math.isnan(fresh_lap_times['vehicle_id'].iloc[1])
@@ -0,0 +1,92 @@
+"""Tests for RaceStrategyAnalyzer"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.race_strategy import RaceStrategyAnalyzer, parse_lap_time
+from src.data_loader import RaceDataLoader
+
+VEHICLES = [2, 13, 46, 72]
+TOTAL_LAPS = 12
+STRATEGY_CALLS = [
+    ('calculate_fuel_strategy', lambda v, lap: (v, lap, TOTAL_LAPS)),
+    ('analyze_race_pace', lambda v, lap: (v, lap)),
+    ('calculate_optimal_pit_strategy', lambda v, lap: (v, lap, TOTAL_LAPS)),
+    ('analyze_sector_performance', lambda v, lap: (v, lap)),
+    ('predict_finish_time', lambda v, lap: (v, lap, TOTAL_LAPS)),
+]
+
+
+@pytest.fixture
+def analysis():
+    # Laps interleaved across vehicles, with some unparseable and missing lap
+    # times and sector gaps, like the endurance analysis exports
+    rng = np.random.default_rng(0)
+    rows = []
+    for lap in range(1, TOTAL_LAPS + 1):
+        for vehicle in rng.permutation(VEHICLES):
+            seconds = 95 + rng.normal(0, 1.5) + 0.05 * lap
+            rows.append({
+                'NUMBER': int(vehicle),
+                'LAP_NUMBER': lap,
+                'LAP_TIME': f"{int(seconds // 60)}:{seconds % 60:06.3f}",
+                'S1_SECONDS': 30 + rng.normal(0, 0.5),
+                'S2_SECONDS': 31 + rng.normal(0, 0.5),
+                'S3_SECONDS': 33 + rng.normal(0, 0.5),
+                'KPH': 140 + rng.normal(0, 3),
+            })
+    df = pd.DataFrame(rows)
+    df.loc[[3, 17, 30], 'LAP_TIME'] = ['PIT', '', np.nan]
+    df.loc[[5, 22], 'S1_SECONDS'] = np.nan
+    return df
+
+
+def run_strategy(make_analyzer, df):
+    # repr compares NaN results as equal
+    return [repr(getattr(make_analyzer(), name)(df, *args(vehicle, lap)))
+            for vehicle in VEHICLES + [999]
+            for lap in (0, 1, 3, 8, TOTAL_LAPS + 5)
+            for name, args in STRATEGY_CALLS]
+
+
+def test_vehicle_laps_match_a_boolean_mask(analysis):
+    analyzer = RaceStrategyAnalyzer()
+    for vehicle in VEHICLES + [999]:
+        for current_lap in (None, 0, 5):
+            expected = analysis[analysis['NUMBER'] == vehicle]
+            if current_lap is not None:
+                expected = expected[expected['LAP_NUMBER'] <= current_lap]
+            pd.testing.assert_frame_equal(analyzer.vehicle_laps(analysis, vehicle, current_lap), expected)
+
+
+def test_reused_analyzer_matches_a_fresh_one_per_call(analysis):
+    # The per-vehicle index is kept for the last frame; switching frames
+    # must not reuse it
+    reused = RaceStrategyAnalyzer()
+    reordered = analysis.iloc[::-1].reset_index(drop=True)
+    for df in (analysis, reordered, analysis.iloc[:20], analysis):
+        assert run_strategy(lambda: reused, df) == run_strategy(RaceStrategyAnalyzer, df)
+
+
+def test_times_to_seconds_matches_the_scalar_parse():
+    times = pd.Series(['1:35.250', '95.5', '0:59.999', 'PIT', '', None, np.nan, '1:xx', '1:02:03.4'])
+    result = RaceDataLoader.times_to_seconds(times)
+    
+    assert result.dtype == np.float64
+    for got, value in zip(result, times):
+        want = RaceDataLoader._time_to_seconds(value)
+        if want is None:
+            assert np.isnan(got), value
+        else:
+            assert got == want, value
+
+
+def test_strategy_results_match_with_lap_times_parsed_at_load(analysis):
+    # RaceDataLoader adds lap_time_seconds; without it the analyzer parses
+    # LAP_TIME itself, with the same results
+    parsed = analysis.assign(lap_time_seconds=RaceDataLoader.times_to_seconds(analysis['LAP_TIME']))
+    assert run_strategy(RaceStrategyAnalyzer, parsed) == run_strategy(RaceStrategyAnalyzer, analysis)
+    
+    parsed_by_analyzer = analysis['LAP_TIME'].apply(parse_lap_time).astype('float64')
+    pd.testing.assert_series_equal(parsed['lap_time_seconds'], parsed_by_analyzer, check_names=False)
@@ -0,0 +1,38 @@
+"""Tests for TelemetryProcessor"""
+
+import numpy as np
+import pandas as pd
+
+from src.telemetry_processor import TelemetryProcessor
+
+HEADER = 'lap,meta_time,timestamp,vehicle_id,telemetry_name,telemetry_value'
+
+
+def write_telemetry(path, samples):
+    # samples: (lap, time, {parameter: value}), written in long format
+    lines = [HEADER]
+    for lap, time, values in samples:
+        stamp = f"2025-09-06T18:00:{time}Z"
+        lines += [f"{lap},{stamp},{stamp},GR86-004-78,{name},{value}" for name, value in values.items()]
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def test_lap_telemetry_keeps_full_value_precision(tmp_path):
+    telemetry_file = tmp_path / 'telemetry.csv'
+    write_telemetry(telemetry_file, [
+        (1, '01.000', {'speed': 173.302, 'aps': 87.61, 'nmot': 6123.457, 'gear': 4}),
+        (1, '01.050', {'speed': 174.019, 'aps': 91.3, 'nmot': 6150.125, 'gear': 4}),
+        (2, '02.000', {'speed': 120.5, 'aps': 10.0, 'nmot': 4000.0, 'gear': 3}),
+    ])
+    processor = TelemetryProcessor(cache_dir=str(tmp_path / 'cache'))
+    
+    lap = processor.process_lap_telemetry(str(telemetry_file), 1, 'barber', 1, sample_rate=1)
+    
+    assert lap['speed'].dtype == np.float64
+    assert lap['speed'].tolist() == [173.302, 174.019]
+    assert lap['nmot'].tolist() == [6123.457, 6150.125]
+    assert [point['speed'] for point in processor.export_for_frontend(lap)] == [173.302, 174.019]
+    
+    # The Parquet cache drops the pivot's columns name, nothing else
+    cached = processor.process_lap_telemetry(str(telemetry_file), 1, 'barber', 1, sample_rate=1)
+    pd.testing.assert_frame_equal(cached, lap, check_names=False)